@@ -1,12 +1,16 @@
 # chat_panel.py
 import gc
+import logging
 import os
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
 from PyQt6.QtWebEngineWidgets import QWebEngineView
-from PyQt6.QtWebEngineCore import QWebEngineProfile, QWebEnginePage, QWebEngineSettings
-from PyQt6.QtCore import QUrl, Qt, QTimer
-from PyQt6.QtGui import QFont, QPalette, QColor
+from PyQt6.QtWebEngineCore import QWebEnginePage, QWebEngineSettings
+from PyQt6.QtCore import QUrl, Qt, QTimer, QEvent
+from PyQt6.QtGui import QFont, QPalette, QColor, QGuiApplication
 import config
+from chat_profile import get_chat_profile
+
+log = logging.getLogger(__name__)
 
 
 class ChatPanel(QWidget):
@@ -27,6 +31,20 @@ class ChatPanel(QWidget):
         # Load chat zoom factor from config
         self.chat_zoom_factor = config.get_config_value("chat_zoom_factor", 0.8)
         
+        # Read once; kept current through config change notifications
+        self.resource_optimization = config.get_config_value("resource_optimization", True)
+        config.signals.value_changed.connect(self.on_config_changed)
+        
+        # Set by the cleanup timer, consumed once the app is inactive
+        self.cleanup_pending = False
+        
+        # Ctrl+wheel bursts update chat_zoom_factor immediately but only
+        # apply it to the view (and config) once the burst settles
+        self.zoom_apply_timer = QTimer(self)
+        self.zoom_apply_timer.setSingleShot(True)
+        self.zoom_apply_timer.setInterval(100)
+        self.zoom_apply_timer.timeout.connect(self.apply_zoom)
+        
         self.setup_ui()
         
     def setup_ui(self):
@@ -71,30 +89,19 @@ class ChatPanel(QWidget):
     def create_chat_browser(self):
         """Create the web browser for IRC chat with persistent storage"""
         try:
-            # Use persistent profile name (no process ID or timestamp)
-            profile_name = "ChatPanel"
-            
-            profile = QWebEngineProfile(profile_name, self)
+            # One profile per application lifetime, shared by all chat views
+            profile = get_chat_profile()
+            optimization_mode = config.get_resource_optimization_mode()
             
             # Use persistent storage paths that survive restarts
             cache_path = config.get_persistent_cache_path("chat")
             storage_path = config.get_persistent_profile_path("chat")
             
-            print(f"Chat using persistent cache: {cache_path}")
-            print(f"Chat using persistent storage: {storage_path}")
-                
-            profile.setCachePath(cache_path)
-            profile.setPersistentStoragePath(storage_path)
-            
-            # Force persistent cookies for login state
-            profile.setPersistentCookiesPolicy(
-                QWebEngineProfile.PersistentCookiesPolicy.ForcePersistentCookies
-            )
-            
             # Optimize settings for chat while preserving login functionality
             settings = profile.settings()
-            if config.get_config_value("resource_optimization", True):
-                settings.setAttribute(QWebEngineSettings.WebAttribute.AutoLoadImages, True)
+            if optimization_mode != "off":
+                # "max" skips images entirely; "min" keeps the chat fully featured
+                settings.setAttribute(QWebEngineSettings.WebAttribute.AutoLoadImages, optimization_mode != "max")
                 settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptEnabled, True)
                 settings.setAttribute(QWebEngineSettings.WebAttribute.LocalStorageEnabled, True)
                 settings.setAttribute(QWebEngineSettings.WebAttribute.PluginsEnabled, False)
@@ -132,12 +139,21 @@ class ChatPanel(QWidget):
             # Connect signals
             self.chat_browser.loadFinished.connect(self.on_chat_load_finished)
             
-            # Enable mouse wheel zoom control
-            self.chat_browser.wheelEvent = self.chat_wheel_event
+            # Enable mouse wheel zoom control. Wheel events land on the view's
+            # render widget (its focus proxy), which Qt may create later, so
+            # new children of the view get the filter as they appear.
+            self.chat_browser.installEventFilter(self)
+            focus_proxy = self.chat_browser.focusProxy()
+            if focus_proxy is not None:
+                focus_proxy.installEventFilter(self)
             
-            # Setup light cleanup timer (preserve login data)
+            # Setup light cleanup timer (preserve login data). The timer only
+            # requests a cleanup; it runs while the app is inactive, so an
+            # open, idle chat never wakes up just to collect.
             self.cleanup_timer = QTimer(self)
-            self.cleanup_timer.timeout.connect(self.perform_cleanup)
+            self.cleanup_timer.setTimerType(Qt.TimerType.VeryCoarseTimer)
+            self.cleanup_timer.timeout.connect(self.request_idle_cleanup)
+            QGuiApplication.instance().applicationStateChanged.connect(self.on_application_state_changed)
             cleanup_interval = config.get_config_value("cache_cleanup_interval", 300) * 1000
             self.cleanup_timer.start(cleanup_interval)
             
@@ -158,58 +174,81 @@ class ChatPanel(QWidget):
             self.cache_path = None
             self.storage_path = None
 
+    def on_config_changed(self, key, value):
+        """Track changes to the cached resource_optimization flag"""
+        if key == "resource_optimization":
+            self.resource_optimization = bool(value)
+
+    def request_idle_cleanup(self):
+        """Run cleanup now if the app is inactive, otherwise once it goes inactive"""
+        self.cleanup_pending = True
+        if QGuiApplication.applicationState() != Qt.ApplicationState.ApplicationActive:
+            self.run_pending_cleanup()
+
+    def on_application_state_changed(self, state):
+        """Use the moment the app goes inactive for pending cleanup"""
+        if state != Qt.ApplicationState.ApplicationActive:
+            self.run_pending_cleanup()
+
+    def run_pending_cleanup(self):
+        """Queue a pending cleanup behind the events already waiting"""
+        if self.cleanup_pending:
+            self.cleanup_pending = False
+            QTimer.singleShot(0, self.perform_cleanup)
+
     def perform_cleanup(self):
         """Perform light cleanup - preserve login data"""
         try:
-            if config.get_config_value("resource_optimization", True):
-                # Only memory cleanup, don't touch persistent storage
-                gc.collect()
+            if self.resource_optimization:
+                # Only memory cleanup, don't touch persistent storage.
+                # Startup objects are frozen, so young generations are enough.
+                gc.collect(generation=1)
         except Exception as e:
-            print(f"Error during chat cleanup: {e}")
+            log.error("Error during chat cleanup: %s", e)
     
-    def chat_wheel_event(self, event):
-        """Handle mouse wheel events for chat zoom control"""
-        try:
-            if event.modifiers() == Qt.KeyboardModifier.ControlModifier:
-                # Ctrl + wheel = zoom
-                delta = event.angleDelta().y()
-                zoom_step = 0.1
-                
-                if delta > 0:
-                    self.chat_zoom_factor += zoom_step
-                else:
-                    self.chat_zoom_factor -= zoom_step
-                    
-                # Clamp zoom factor to reasonable bounds
-                self.chat_zoom_factor = max(0.25, min(self.chat_zoom_factor, 3.0))
-                
-                # Apply zoom
-                self.chat_browser.setZoomFactor(self.chat_zoom_factor)
-                
-                # Save to config immediately
-                config.set_config_value("chat_zoom_factor", self.chat_zoom_factor)
-                print(f"Chat zoom set to: {int(self.chat_zoom_factor * 100)}%")
-                
-                event.accept()
-            else:
-                # Normal scrolling
-                QWebEngineView.wheelEvent(self.chat_browser, event)
-        except Exception as e:
-            print(f"Error in chat wheelEvent: {e}")
-            QWebEngineView.wheelEvent(self.chat_browser, event)
+    def eventFilter(self, obj, event):
+        """Handle Ctrl+wheel chat zoom; everything else passes straight through"""
+        event_type = event.type()
+        
+        if event_type == QEvent.Type.ChildAdded and obj is self.chat_browser:
+            child = event.child()
+            if child.isWidgetType():
+                child.installEventFilter(self)
+        elif (event_type == QEvent.Type.Wheel
+                and event.modifiers() == Qt.KeyboardModifier.ControlModifier):
+            # Ctrl + wheel = zoom
+            zoom_step = 0.1 if event.angleDelta().y() > 0 else -0.1
+            
+            # Clamp zoom factor to reasonable bounds
+            self.chat_zoom_factor = max(0.25, min(self.chat_zoom_factor + zoom_step, 3.0))
+            
+            # Apply zoom once the wheel burst settles
+            self.zoom_apply_timer.start()
+            
+            event.accept()
+            return True
+        
+        return super().eventFilter(obj, event)
+    
+    def apply_zoom(self):
+        """Apply the pending chat zoom factor to the view and save it"""
+        self.chat_browser.setZoomFactor(self.chat_zoom_factor)
+        config.set_config_value("chat_zoom_factor", self.chat_zoom_factor)
+        log.debug("Chat zoom set to: %d%%", int(self.chat_zoom_factor * 100))
     
     def on_chat_load_finished(self, ok: bool):
         """Handle chat page load completion"""
         if ok:
-            print("✅ Chat panel loaded successfully with persistent storage")
+            log.debug("Chat panel loaded successfully with persistent storage")
             try:
-                # Apply saved zoom factor after page loads
-                self.chat_browser.setZoomFactor(self.chat_zoom_factor)
-                print(f"Applied chat zoom: {int(self.chat_zoom_factor * 100)}%")
+                # Re-apply the saved zoom only if the page came back with a
+                # different one - every setZoomFactor forces a relayout
+                if abs(self.chat_browser.zoomFactor() - self.chat_zoom_factor) > 1e-3:
+                    self.chat_browser.setZoomFactor(self.chat_zoom_factor)
             except Exception as e:
-                print(f"Error setting chat zoom factor: {e}")
+                log.error("Error setting chat zoom factor: %s", e)
         else:
-            print("❌ Failed to load chat panel")
+            log.warning("Failed to load chat panel")
     
     def load_chat_url(self, url):
         """Load a new URL in the chat browser"""
@@ -255,6 +294,8 @@ class ChatPanel(QWidget):
         # Stop cleanup timer
         if hasattr(self, 'cleanup_timer'):
             self.cleanup_timer.stop()
+        self.cleanup_pending = False
+        self.zoom_apply_timer.stop()
         
         # Save final chat zoom factor
         try:
@@ -274,5 +315,7 @@ class ChatPanel(QWidget):
         # Don't clean persistent storage - it contains login data and settings
         print("Chat panel closed - login data and settings preserved")
         
-        gc.collect()
+        # Flush any coalesced config writes before the panel goes away
+        config.force_save_config()
+        
         super().closeEvent(event)
@@ -0,0 +1,72 @@
+# chat_profile.py - Single shared web engine profile for the IRC chat
+import logging
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtWebEngineCore import QWebEngineProfile
+try:
+    # Qt 6.9+ can build a fully configured profile in one step
+    from PyQt6.QtWebEngineCore import QWebEngineProfileBuilder
+except ImportError:
+    QWebEngineProfileBuilder = None
+import config
+
+log = logging.getLogger(__name__)
+
+# Keep chat images and scripts cached across restarts
+CHAT_HTTP_CACHE_SIZE = 200 * 1024 * 1024
+
+# Storage locations must be unique for the whole application lifetime, so
+# the profile is created once and shared by every chat view
+_chat_profile = None
+
+
+def get_chat_profile(parent=None):
+    """Get the shared chat profile, creating it on first use"""
+    global _chat_profile
+    if _chat_profile is None:
+        _chat_profile = create_chat_profile(parent or QApplication.instance())
+    return _chat_profile
+
+
+def create_chat_profile(parent):
+    """Create the chat profile with persistent storage"""
+    # Use persistent profile name (no process ID or timestamp)
+    profile_name = "ChatPanel"
+    
+    # Use persistent storage paths that survive restarts
+    cache_path = config.get_persistent_cache_path("chat")
+    storage_path = config.get_persistent_profile_path("chat")
+    
+    log.debug("Chat using persistent cache: %s", cache_path)
+    log.debug("Chat using persistent storage: %s", storage_path)
+    
+    if config.get_resource_optimization_mode() == "max":
+        # Low-memory mode: in-memory cache and cookies, nothing on disk.
+        # Chat logins do not survive a restart in this mode.
+        log.debug("Chat using off-the-record profile (max resource optimization)")
+        if QWebEngineProfileBuilder is not None:
+            return QWebEngineProfileBuilder.createOffTheRecordProfile(parent)
+        return QWebEngineProfile(parent)
+    
+    if QWebEngineProfileBuilder is not None:
+        # Configure the profile before it is created, as Qt recommends
+        builder = QWebEngineProfileBuilder()
+        builder.setCachePath(cache_path)
+        builder.setPersistentStoragePath(storage_path)
+        builder.setPersistentCookiesPolicy(
+            QWebEngineProfile.PersistentCookiesPolicy.ForcePersistentCookies
+        )
+        builder.setHttpCacheType(QWebEngineProfile.HttpCacheType.DiskHttpCache)
+        builder.setHttpCacheMaximumSize(CHAT_HTTP_CACHE_SIZE)
+        return builder.createProfile(profile_name, parent)
+    
+    profile = QWebEngineProfile(profile_name, parent)
+    profile.setCachePath(cache_path)
+    profile.setPersistentStoragePath(storage_path)
+    
+    # Force persistent cookies for login state
+    profile.setPersistentCookiesPolicy(
+        QWebEngineProfile.PersistentCookiesPolicy.ForcePersistentCookies
+    )
+    profile.setHttpCacheType(QWebEngineProfile.HttpCacheType.DiskHttpCache)
+    profile.setHttpCacheMaximumSize(CHAT_HTTP_CACHE_SIZE)
+    return profile
@@ -1,10 +1,34 @@
 # config.py - Fixed for persistent storage and proper config saving
 import json
+import logging
 import os
+import sys
 import threading
 import time
 from pathlib import Path
-from PyQt6.QtCore import QStandardPaths
+from PyQt6.QtCore import QObject, QStandardPaths, QTimer, QRunnable, QThreadPool, pyqtSignal
+
+# orjson is optional - it encodes straight to bytes and is much faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+log = logging.getLogger(__name__)
+
+# Chromium reads these flags once, when QApplication starts QtWebEngine, so
+# they are applied at import time. Windows only - other platforms are unaffected.
+# The native window occlusion check is skipped so the game keeps rendering
+# smoothly while partly covered. Disk cache sizes are set per profile.
+CHROMIUM_FLAGS = (
+    "--disable-gpu-compositing",
+    "--enable-gpu-rasterization",
+    "--enable-zero-copy",
+    "--ignore-gpu-blocklist",
+    "--disable-features=CalculateNativeWinOcclusion",
+)
+if sys.platform == "win32":
+    os.environ.setdefault("QTWEBENGINE_CHROMIUM_FLAGS", " ".join(CHROMIUM_FLAGS))
 
 # Thread-safe config access
 _config_lock = threading.RLock()
@@ -12,22 +36,55 @@ _config_cache = None
 _cache_time = 0
 CACHE_DURATION = 2  # Reduced cache duration for more responsive config saving
 
+# Coalesced saving - set_config_value marks the cache dirty and one timer writes it
+SAVE_DELAY_MS = 500
+_dirty = False
+_save_timer = None
+
+# Directories already created by this process. Paths are keyed by their full
+# location, which follows the application name main() sets after import.
+_created_dirs = set()
+
+# Disk writes happen on QThreadPool workers; generations keep a late job
+# from overwriting a newer snapshot
+_write_lock = threading.Lock()
+_save_generation = 0
+_written_generation = 0
+
+class ConfigSignals(QObject):
+    """Notifies subscribers when set_config_value changes a key"""
+    value_changed = pyqtSignal(str, object)
+
+# Widgets that cache config values connect here instead of re-reading them
+signals = ConfigSignals()
+
+def _dumps(data):
+    """Encode config data to UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+def _ensure_dir(path):
+    """Create path once per process and return it"""
+    if path not in _created_dirs:
+        os.makedirs(path, exist_ok=True)
+        _created_dirs.add(path)
+    return path
+
 def get_app_data_dir():
     """Get persistent application data directory"""
+    # Resolved on every call, never memoized: AppDataLocation depends on the
+    # application and organization names, which are only set in main()
     try:
         # Use system config directory that persists across restarts
         app_data_dir = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation)
         if app_data_dir:
-            app_path = Path(app_data_dir)
-            app_path.mkdir(parents=True, exist_ok=True)
-            return str(app_path)
+            return _ensure_dir(str(Path(app_data_dir)))
     except Exception as e:
-        print(f"Warning: Could not create system app data directory: {e}")
+        log.warning("Could not create system app data directory: %s", e)
     
     # Fallback to local app_data directory
-    local_dir = Path("app_data")
-    local_dir.mkdir(exist_ok=True)
-    return str(local_dir)
+    return _ensure_dir("app_data")
 
 def get_config_path():
     """Get persistent config file path"""
@@ -35,16 +92,14 @@ def get_config_path():
 
 def get_persistent_cache_dir():
     """Get persistent cache directory that survives restarts"""
-    cache_dir = Path(get_app_data_dir()) / "cache"
-    cache_dir.mkdir(exist_ok=True)
-    return str(cache_dir)
+    return _ensure_dir(os.path.join(get_app_data_dir(), "cache"))
 
 def get_persistent_storage_dir():
     """Get persistent storage directory for web engine data"""
-    storage_dir = Path(get_app_data_dir()) / "storage"
-    storage_dir.mkdir(exist_ok=True)
-    return str(storage_dir)
+    return _ensure_dir(os.path.join(get_app_data_dir(), "storage"))
 
+# Resolved at import, before the application is named - existing installs
+# keep their config.json at this location
 CONFIG_FILE = get_config_path()
 
 DEFAULT_CONFIG = {
@@ -59,8 +114,16 @@ DEFAULT_CONFIG = {
     "chat_panel_height": 200,
     "chat_zoom_factor": 0.8,
     "resource_optimization": True,
+    # Only used while resource_optimization is on:
+    #   "min" - trims unused browser features, keeps images and persistent logins
+    #   "max" - low-memory mode: no images, in-memory chat cache/cookies (logins
+    #           are not kept between restarts)
+    "resource_optimization_mode": "min",
     "cache_cleanup_interval": 300,
     "max_tool_windows": 10,
+    # Tool browsers keep their HTTP cache in memory unless this is on; cookies
+    # and local storage stay on disk either way
+    "tool_disk_cache": False,
     # Individual tool window geometries
 }
 
@@ -69,10 +132,11 @@ def load_config():
     global _config_cache, _cache_time
     
     with _config_lock:
-        current_time = time.time()
+        current_time = time.monotonic()
         
-        # Return cached config if still valid
-        if _config_cache and (current_time - _cache_time) < CACHE_DURATION:
+        # Return cached config if still valid (callers may mutate the result).
+        # Unsaved changes must never be replaced by a re-read from disk.
+        if _config_cache and (_dirty or (current_time - _cache_time) < CACHE_DURATION):
             return _config_cache.copy()
         
         config = DEFAULT_CONFIG.copy()
@@ -117,9 +181,13 @@ def load_config():
                 config["chat_panel_visible"] = bool(config.get("chat_panel_visible", True))
                 config["resource_optimization"] = bool(config.get("resource_optimization", True))
                 config["right_panel_collapsed"] = bool(config.get("right_panel_collapsed", False))
+                config["tool_disk_cache"] = bool(config.get("tool_disk_cache", False))
+                
+                if config.get("resource_optimization_mode") not in ("min", "max"):
+                    config["resource_optimization_mode"] = "min"
                 
             except Exception as e:
-                print(f"Error loading config: {e}. Using defaults.")
+                log.error("Error loading config: %s. Using defaults.", e)
                 config = DEFAULT_CONFIG.copy()
         
         # Cache the config
@@ -127,41 +195,45 @@ def load_config():
         _cache_time = current_time
         return config
 
-def save_config(config):
-    """Save configuration with atomic writes and immediate disk flush"""
-    global _config_cache, _cache_time
+class _SaveJob(QRunnable):
+    """Writes a pre-encoded config payload from the global thread pool"""
     
-    with _config_lock:
+    def __init__(self, payload, generation):
+        super().__init__()
+        self.payload = payload
+        self.generation = generation
+    
+    def run(self):
+        _write_config_file(self.payload, self.generation)
+
+def _write_config_file(payload, generation):
+    """Atomically write an encoded config payload to disk"""
+    global _written_generation
+    
+    with _write_lock:
+        # A newer snapshot has already reached the disk
+        if generation < _written_generation:
+            return
+        
+        temp_file = CONFIG_FILE + ".tmp"
         try:
             # Ensure config directory exists
             os.makedirs(os.path.dirname(CONFIG_FILE), exist_ok=True)
             
-            # Validate config before saving
-            validated_config = DEFAULT_CONFIG.copy()
-            for key, value in config.items():
-                validated_config[key] = value
-            
             # Atomic write using temporary file
-            temp_file = CONFIG_FILE + ".tmp"
-            
-            with open(temp_file, "w", encoding='utf-8') as f:
-                json.dump(validated_config, f, indent=4, ensure_ascii=False)
+            with open(temp_file, "wb") as f:
+                f.write(payload)
                 f.flush()  # Force write to disk
                 os.fsync(f.fileno())  # Force OS to write to disk
             
-            # Atomic move (on most systems)
-            if os.path.exists(CONFIG_FILE):
-                os.remove(CONFIG_FILE)
-            os.rename(temp_file, CONFIG_FILE)
+            # Atomic move - os.replace overwrites the old file on all platforms
+            os.replace(temp_file, CONFIG_FILE)
             
-            # Update cache
-            _config_cache = validated_config.copy()
-            _cache_time = time.time()
-            
-            print(f"Config saved to: {CONFIG_FILE}")
+            _written_generation = generation
+            log.debug("Config saved to: %s", CONFIG_FILE)
                 
         except Exception as e:
-            print(f"Error saving config: {e}")
+            log.error("Error saving config: %s", e)
             # Clean up temp file on error
             if os.path.exists(temp_file):
                 try:
@@ -169,31 +241,114 @@ def save_config(config):
                 except:
                     pass
 
+def save_config(config, wait=False):
+    """Save configuration - the disk write runs on the global thread pool unless wait is set"""
+    global _config_cache, _cache_time, _save_generation
+    
+    with _config_lock:
+        try:
+            # Validate config before saving
+            validated_config = DEFAULT_CONFIG.copy()
+            for key, value in config.items():
+                validated_config[key] = value
+            
+            payload = _dumps(validated_config)
+            
+            # Update cache
+            _config_cache = validated_config.copy()
+            _cache_time = time.monotonic()
+            
+            _save_generation += 1
+            generation = _save_generation
+        except Exception as e:
+            log.error("Error saving config: %s", e)
+            return
+    
+    if wait:
+        _write_config_file(payload, generation)
+    else:
+        QThreadPool.globalInstance().start(_SaveJob(payload, generation))
+
 def get_config_value(key, default=None):
-    """Get a single config value"""
-    config = load_config()
-    return config.get(key, default)
+    """Get a single config value without copying the cached config"""
+    # Fast path: read straight from the cache without taking the lock. This
+    # process is the only writer and set_config_values updates the cache in
+    # place, so single-key reads never need to go back to the disk.
+    cache = _config_cache
+    if cache:
+        return cache.get(key, default)
+    
+    with _config_lock:
+        load_config()
+        return _config_cache.get(key, default)
+
+def get_resource_optimization_mode():
+    """Get the effective resource optimization mode ("off", "min" or "max")"""
+    if not get_config_value("resource_optimization", True):
+        return "off"
+    return get_config_value("resource_optimization_mode", "min")
 
 def set_config_value(key, value):
-    """Set a single config value and save immediately"""
-    config = load_config()
-    config[key] = value
-    save_config(config)
+    """Set a single config value and schedule a coalesced save"""
+    set_config_values({key: value})
+
+def set_config_values(values):
+    """Set several config values at once and schedule one coalesced save"""
+    global _cache_time, _dirty
+    
+    with _config_lock:
+        # Mutate the cache in place - only a cold start needs a disk read
+        if _config_cache is None:
+            load_config()
+        changed = [(key, value) for key, value in values.items()
+                   if _config_cache.get(key) != value]
+        _config_cache.update(values)
+        _cache_time = time.monotonic()
+        _dirty = True
+    
+    schedule_save()
+    for key, value in changed:
+        signals.value_changed.emit(key, value)
+
+def schedule_save():
+    """Save the cached config once SAVE_DELAY_MS after the first pending change"""
+    global _save_timer
+    
+    if _save_timer is None:
+        _save_timer = QTimer()
+        _save_timer.setSingleShot(True)
+        _save_timer.timeout.connect(_flush_dirty)
+    
+    if not _save_timer.isActive():
+        _save_timer.start(SAVE_DELAY_MS)
+
+def _flush_dirty():
+    """Write the cached config if it has unsaved changes"""
+    global _dirty
+    
+    with _config_lock:
+        if not _dirty or not _config_cache:
+            return
+        _dirty = False
+        save_config(_config_cache)
 
 def force_save_config():
     """Force save current cached config to disk"""
-    global _config_cache
-    if _config_cache:
-        save_config(_config_cache)
+    global _dirty
+    
+    # The timer belongs to the GUI thread; elsewhere clearing _dirty is enough
+    if _save_timer is not None and threading.current_thread() is threading.main_thread():
+        _save_timer.stop()
+    
+    with _config_lock:
+        _dirty = False
+        if _config_cache:
+            save_config(_config_cache, wait=True)
 
 def get_persistent_profile_path(profile_name):
     """Get persistent profile path that survives application restarts"""
-    profile_dir = Path(get_persistent_storage_dir()) / profile_name
-    profile_dir.mkdir(parents=True, exist_ok=True)
-    return str(profile_dir)
+    return _ensure_dir(os.path.join(get_persistent_storage_dir(), profile_name))
 
 def get_persistent_cache_path(cache_name):
     """Get persistent cache path that survives application restarts"""
-    cache_path = Path(get_persistent_cache_dir()) / cache_name
-    cache_path.mkdir(parents=True, exist_ok=True)
-    return str(cache_path)
+    return _ensure_dir(os.path.join(get_persistent_cache_dir(), cache_name))
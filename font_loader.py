@@ -1,8 +1,36 @@
 # font_loader.py - Fixed TTF font loading with proper scaling and detection
+import fnmatch
+import logging
 import os
 import sys
 from PyQt6.QtGui import QFontDatabase, QFont
-from PyQt6.QtCore import QStandardPaths
+from PyQt6.QtCore import QByteArray
+
+log = logging.getLogger(__name__)
+
+# Font file lookup order - exact name, then RuneScape/Quill variants, then any
+# TTF. Patterns are lowercase and matched against lowercased file names.
+TTF_SEARCH_PATTERNS = (
+    "runescape-quill-caps.ttf",
+    "*runescape*quill*.ttf",
+    "*quill*runescape*.ttf",
+    "*runescape*.ttf",
+    "*.ttf",
+)
+
+_app_dir = None
+
+def get_app_dir():
+    """Get the directory holding bundled resources (cached)"""
+    global _app_dir
+    if _app_dir is None:
+        if getattr(sys, "frozen", False):
+            # Running as a standalone exe
+            _app_dir = os.path.dirname(sys.executable)
+        else:
+            # Running as a script
+            _app_dir = os.path.dirname(os.path.abspath(__file__))
+    return _app_dir
 
 
 class FontLoader:
@@ -10,65 +38,41 @@ class FontLoader:
         self.custom_font_loaded = False
         self.font_family_name = None
         self.fallback_fonts = ["RuneScape UF", "runescape_uf", "Arial"]
+        # Resolved fonts keyed by (scaled size, weight) - the font database
+        # lookup behind exactMatch() only runs once per key
+        self._font_cache = {}
+        # Family used for readable UI text, resolved on first use
+        self._ui_family = None
+        # Readable UI fonts keyed by (point size, weight)
+        self._ui_font_cache = {}
         
     def load_custom_font(self):
         """Load the custom TTF font from the application directory"""
         try:
-            # Determine correct app directory
-            if getattr(sys, "frozen", False):
-                # Running as a standalone exe
-                app_dir = os.path.dirname(sys.executable)
-            else:
-                # Running as a script
-                app_dir = os.path.dirname(os.path.abspath(__file__))
-                
-            ttf_files = [f for f in os.listdir(app_dir) if f.lower().endswith('.ttf')]
+            app_dir = get_app_dir()
             
-            if not ttf_files:
-                print("No TTF files found in application directory")
-                return False
-            
-            print(f"Found TTF files: {ttf_files}")
-                
-            # Prioritize Runescape-Quill-Caps.ttf specifically
+            # List the directory once and try the patterns on that listing,
+            # most specific first; matching ignores case like the file systems
+            # on Windows do
+            file_names = sorted(os.listdir(app_dir))
             ttf_file = None
-            
-            # First priority: exact match for Runescape-Quill-Caps.ttf
-            for f in ttf_files:
-                if f.lower() == 'runescape-quill-caps.ttf':
-                    ttf_file = f
-                    print(f"Found exact match: {ttf_file}")
+            for pattern in TTF_SEARCH_PATTERNS:
+                ttf_file = next((name for name in file_names
+                                 if fnmatch.fnmatchcase(name.lower(), pattern)), None)
+                if ttf_file:
+                    print(f"Found TTF match for {pattern}: {ttf_file}")
                     break
             
-            # Second priority: any file containing 'runescape' and 'quill'
-            if not ttf_file:
-                for f in ttf_files:
-                    if 'runescape' in f.lower() and 'quill' in f.lower():
-                        ttf_file = f
-                        print(f"Found runescape-quill match: {ttf_file}")
-                        break
-            
-            # Third priority: any file containing 'runescape'
             if not ttf_file:
-                for f in ttf_files:
-                    if 'runescape' in f.lower():
-                        ttf_file = f
-                        print(f"Found runescape match: {ttf_file}")
-                        break
+                print("No TTF files found in application directory")
+                return False
             
-            # Last resort: use first TTF file
-            if not ttf_file:
-                ttf_file = ttf_files[0]
-                print(f"Using first available TTF: {ttf_file}")
-                
             font_path = os.path.join(app_dir, ttf_file)
             
-            if not os.path.exists(font_path):
-                print(f"TTF font file not found: {font_path}")
-                return False
-            
-            # Load the font into Qt's font database
-            font_id = QFontDatabase.addApplicationFont(font_path)
+            # Read the file once and hand the bytes to Qt's font database
+            with open(font_path, "rb") as f:
+                font_data = QByteArray(f.read())
+            font_id = QFontDatabase.addApplicationFontFromData(font_data)
             
             if font_id == -1:
                 print(f"Failed to load custom font: {font_path}")
@@ -83,6 +87,9 @@ class FontLoader:
             
             self.font_family_name = font_families[0]
             self.custom_font_loaded = True
+            self._font_cache.clear()
+            self._ui_family = None
+            self._ui_font_cache.clear()
             
             print(f"✅ Custom font loaded successfully: {self.font_family_name}")
             print(f"   From file: {ttf_file}")
@@ -98,23 +105,35 @@ class FontLoader:
         # Scale font size by 1.7x for readable but larger text (was 5x before)
         scaled_size = int(size * 1.7)
         
+        key = (scaled_size, weight)
+        cached = self._font_cache.get(key)
+        if cached is not None:
+            # Hand out a copy so callers can tweak their font freely
+            return QFont(cached)
+        
+        font = self._resolve_font(scaled_size, weight)
+        self._font_cache[key] = font
+        return QFont(font)
+    
+    def _resolve_font(self, scaled_size, weight):
+        """Find the best available font for a scaled size and weight"""
         if self.custom_font_loaded and self.font_family_name:
             font = QFont(self.font_family_name, scaled_size, weight)
             if font.exactMatch():
-                print(f"Using custom font: {self.font_family_name} at {scaled_size}pt")
+                log.debug("Using custom font: %s at %dpt", self.font_family_name, scaled_size)
                 return font
             else:
-                print(f"Custom font {self.font_family_name} not exact match, trying fallbacks")
+                log.debug("Custom font %s not exact match, trying fallbacks", self.font_family_name)
         
         # Try fallback fonts
         for fallback in self.fallback_fonts:
             font = QFont(fallback, scaled_size, weight)
             if font.exactMatch():
-                print(f"Using fallback font: {fallback} at {scaled_size}pt")
+                log.debug("Using fallback font: %s at %dpt", fallback, scaled_size)
                 return font
         
         # Ultimate fallback
-        print(f"Using ultimate fallback: Arial at {scaled_size}pt")
+        log.debug("Using ultimate fallback: Arial at %dpt", scaled_size)
         return QFont("Arial", scaled_size, weight)
     
     def get_font_family_name(self):
@@ -123,6 +142,30 @@ class FontLoader:
             return self.font_family_name
         return self.fallback_fonts[0]
     
+    def get_ui_family(self):
+        """Get the family for readable UI text: custom font, Runescape-Quill-Caps or Arial"""
+        if self._ui_family is None:
+            if self.custom_font_loaded and self.font_family_name:
+                self._ui_family = self.font_family_name
+            elif QFont("Runescape-Quill-Caps", 18).exactMatch():
+                self._ui_family = "Runescape-Quill-Caps"
+            else:
+                self._ui_family = "Arial"
+        return self._ui_family
+    
+    def get_ui_font(self, point_size, weight=QFont.Weight.Normal):
+        """Get a readable UI font in the get_ui_family family, built once per size/weight"""
+        key = (point_size, weight)
+        font = self._ui_font_cache.get(key)
+        if font is None:
+            font = QFont()
+            font.setFamily(self.get_ui_family())
+            font.setPointSize(point_size)
+            font.setWeight(weight)
+            self._ui_font_cache[key] = font
+        # QFont is implicitly shared, so the copy is cheap
+        return QFont(font)
+    
     def is_custom_font_available(self):
         """Check if custom font is successfully loaded"""
         return self.custom_font_loaded
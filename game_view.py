@@ -1,18 +1,100 @@
 # game_view.py - Fixed syntax error on line 199
 import gc
-import os
+import logging
+# GameViewWidget subclasses QWebEngineView, so QtWebEngine has to be imported
+# with the module; it cannot be deferred to construction time
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 from PyQt6.QtWebEngineCore import QWebEngineProfile, QWebEnginePage, QWebEngineSettings
-from PyQt6.QtCore import Qt, QUrl, QDir, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, QUrl, pyqtSignal, QTimer
+from PyQt6.QtGui import QGuiApplication
 import config
 
+log = logging.getLogger(__name__)
+
+# Upper bound for the game's HTTP disk cache
+GAME_HTTP_CACHE_SIZE = 100 * 1024 * 1024
+
+# Parsed game URLs, shared across views and world switches
+_URL_CACHE = {}
+
+# Game profile settings, resolved once at import
+_WebAttribute = QWebEngineSettings.WebAttribute
+GAME_SETTINGS = (
+    # Enable hardware acceleration and GPU features for game
+    (_WebAttribute.Accelerated2dCanvasEnabled, True),
+    (_WebAttribute.WebGLEnabled, True),
+    # Essential features for game and login functionality
+    (_WebAttribute.JavascriptEnabled, True),
+    (_WebAttribute.LocalStorageEnabled, True),
+    (_WebAttribute.AutoLoadImages, True),
+    (_WebAttribute.PlaybackRequiresUserGesture, False),
+    (_WebAttribute.AllowRunningInsecureContent, True),
+    (_WebAttribute.FocusOnNavigationEnabled, True),
+    # Disable only non-essential features
+    (_WebAttribute.PluginsEnabled, False),
+)
+
+# Extra trimming applied when resource_optimization is on
+GAME_OPTIMIZED_SETTINGS = (
+    (_WebAttribute.ScrollAnimatorEnabled, False),
+    (_WebAttribute.TouchIconsEnabled, False),
+)
+
+
+def resolve_url(url):
+    """Return a QUrl for url, parsing each distinct string only once"""
+    qurl = _URL_CACHE.get(url)
+    if qurl is None:
+        qurl = _URL_CACHE[url] = QUrl(url)
+    return qurl
+
+
+def prepare_game_storage():
+    """Create the game's persistent cache and storage directories.
+
+    Pure filesystem work, so it is safe to run on a worker thread while the
+    GUI thread is busy elsewhere; later calls hit the config path caches.
+    """
+    cache_path = config.get_persistent_cache_path("game_cache")
+    storage_path = config.get_persistent_profile_path("game_profile")
+    return cache_path, storage_path
+
 
 class GameViewWidget(QWebEngineView):
     zoom_changed = pyqtSignal(float)
     
     def __init__(self, url, parent=None):
         super().__init__(parent)
+        
+        # Set by the cleanup timer, consumed at the next idle moment
+        self.cleanup_pending = False
+        
+        # Each cleanup collects a single generation, cycling 0 -> 1 -> 2
+        self.gc_generation = 0
+        
+        # Read once; kept current through config change notifications
+        self.resource_optimization = config.get_config_value("resource_optimization", True)
+        config.signals.value_changed.connect(self.on_config_changed)
+        
+        # Zoom changes are persisted once per burst, not per wheel tick/key press
+        self.zoom_save_timer = QTimer(self)
+        self.zoom_save_timer.setSingleShot(True)
+        self.zoom_save_timer.setInterval(500)
+        self.zoom_save_timer.timeout.connect(self.save_zoom_factor)
+        
+        # Construction allocates a burst of wrappers - collect once at the end
+        # instead of letting gen0 sweeps fire part-way through
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            self.setup_view(url)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+                gc.collect(0)
 
+    def setup_view(self, url):
+        """Create the persistent profile and page and start loading the game"""
         try:
             # Use persistent profile that survives application restarts
             profile_name = "LostCityGame"  # Fixed name, no process ID
@@ -20,8 +102,7 @@ class GameViewWidget(QWebEngineView):
             profile = QWebEngineProfile(profile_name, self)
             
             # Use persistent directories that survive application restarts
-            cache_path = config.get_persistent_cache_path("game_cache")
-            storage_path = config.get_persistent_profile_path("game_profile")
+            cache_path, storage_path = prepare_game_storage()
             
             print(f"Game using persistent cache: {cache_path}")
             print(f"Game using persistent storage: {storage_path}")
@@ -29,6 +110,10 @@ class GameViewWidget(QWebEngineView):
             profile.setCachePath(cache_path)
             profile.setPersistentStoragePath(storage_path)
             
+            # Bounded on-disk HTTP cache instead of Chromium's disk-relative default
+            profile.setHttpCacheType(QWebEngineProfile.HttpCacheType.DiskHttpCache)
+            profile.setHttpCacheMaximumSize(GAME_HTTP_CACHE_SIZE)
+            
             # Force persistent cookies
             profile.setPersistentCookiesPolicy(
                 QWebEngineProfile.PersistentCookiesPolicy.ForcePersistentCookies
@@ -36,24 +121,11 @@ class GameViewWidget(QWebEngineView):
             
             # Performance optimizations but keep all login-related features
             settings = profile.settings()
-            
-            # Enable hardware acceleration and GPU features for game
-            settings.setAttribute(QWebEngineSettings.WebAttribute.Accelerated2dCanvasEnabled, True)
-            settings.setAttribute(QWebEngineSettings.WebAttribute.WebGLEnabled, True)
-            
-            # Essential features for game and login functionality
-            settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptEnabled, True)
-            settings.setAttribute(QWebEngineSettings.WebAttribute.LocalStorageEnabled, True)
-            settings.setAttribute(QWebEngineSettings.WebAttribute.AutoLoadImages, True)
-            settings.setAttribute(QWebEngineSettings.WebAttribute.PlaybackRequiresUserGesture, False)
-            settings.setAttribute(QWebEngineSettings.WebAttribute.AllowRunningInsecureContent, True)
-            settings.setAttribute(QWebEngineSettings.WebAttribute.FocusOnNavigationEnabled, True)
-            
-            # Disable only non-essential features
-            settings.setAttribute(QWebEngineSettings.WebAttribute.PluginsEnabled, False)
-            if config.get_config_value("resource_optimization", True):
-                settings.setAttribute(QWebEngineSettings.WebAttribute.ScrollAnimatorEnabled, False)
-                settings.setAttribute(QWebEngineSettings.WebAttribute.TouchIconsEnabled, False)
+            for attribute, enabled in GAME_SETTINGS:
+                settings.setAttribute(attribute, enabled)
+            if self.resource_optimization:
+                for attribute, enabled in GAME_OPTIMIZED_SETTINGS:
+                    settings.setAttribute(attribute, enabled)
 
             page = QWebEnginePage(profile, self)
             self.setPage(page)
@@ -63,7 +135,7 @@ class GameViewWidget(QWebEngineView):
             self.storage_path = storage_path
 
             # Load the game
-            self.setUrl(QUrl(url))
+            self.setUrl(resolve_url(url))
 
             # Load zoom factor from config
             self.zoom_factor = config.get_config_value("zoom_factor", 1.0)
@@ -75,9 +147,12 @@ class GameViewWidget(QWebEngineView):
             # Enable focus for keyboard events
             self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
             
-            # Setup cleanup timer (but preserve persistent data)
+            # Setup cleanup timer (but preserve persistent data). The timer only
+            # requests a cleanup; it runs once the app is idle or a load completes.
             self.cleanup_timer = QTimer(self)
-            self.cleanup_timer.timeout.connect(self.perform_cleanup)
+            self.cleanup_timer.setTimerType(Qt.TimerType.VeryCoarseTimer)
+            self.cleanup_timer.timeout.connect(self.request_idle_cleanup)
+            QGuiApplication.instance().applicationStateChanged.connect(self.on_application_state_changed)
             cleanup_interval = config.get_config_value("cache_cleanup_interval", 300) * 1000
             self.cleanup_timer.start(cleanup_interval)
             
@@ -87,117 +162,111 @@ class GameViewWidget(QWebEngineView):
             self.cache_path = None
             self.storage_path = None
 
+    def on_config_changed(self, key, value):
+        """Track changes to the cached resource_optimization flag"""
+        if key == "resource_optimization":
+            self.resource_optimization = bool(value)
+
+    def request_idle_cleanup(self):
+        """Run cleanup now if the app is idle, otherwise at the next idle moment"""
+        self.cleanup_pending = True
+        if QGuiApplication.applicationState() != Qt.ApplicationState.ApplicationActive:
+            self.run_pending_cleanup()
+
+    def on_application_state_changed(self, state):
+        """Use the moment the app goes inactive for pending cleanup"""
+        if state != Qt.ApplicationState.ApplicationActive:
+            self.run_pending_cleanup()
+
+    def run_pending_cleanup(self):
+        """Queue a pending cleanup behind the events already waiting"""
+        if self.cleanup_pending:
+            self.cleanup_pending = False
+            QTimer.singleShot(0, self.perform_cleanup)
+
     def perform_cleanup(self):
         """Perform light cleanup without removing persistent data"""
         try:
-            if config.get_config_value("resource_optimization", True):
-                # Only do memory cleanup, don't touch persistent storage
-                gc.collect()
-                print("Performed light game view cleanup (preserved login data)")
+            if self.resource_optimization:
+                # Only do memory cleanup, don't touch persistent storage.
+                # One generation per tick, so only every third cleanup sweeps
+                # the whole WebEngine object graph.
+                generation = self.gc_generation
+                self.gc_generation = (generation + 1) % 3
+                gc.collect(generation)
+                log.debug("Performed light game view cleanup of generation %d (preserved login data)", generation)
         except Exception as e:
-            print(f"Error during game view cleanup: {e}")
+            log.error("Error during game view cleanup: %s", e)
 
     def on_load_finished(self, ok: bool):
         """Handle page load completion"""
         if ok:
-            print("✅ Game page loaded successfully with persistent storage.")
+            log.debug("Game page loaded successfully with persistent storage")
+            # Right after a load is a natural pause for pending cleanup
+            self.run_pending_cleanup()
             try:
                 self.setZoomFactor(self.zoom_factor)
             except Exception as e:
-                print(f"Error setting zoom factor: {e}")
+                log.error("Error setting zoom factor: %s", e)
         else:
-            print("❌ Failed to load game page.")
+            log.warning("Failed to load game page")
+
+    def set_zoom(self, factor):
+        """Clamp, apply and announce a zoom factor; saving is debounced"""
+        self.zoom_factor = max(0.25, min(factor, 5.0))
+        self.setZoomFactor(self.zoom_factor)
+        self.zoom_save_timer.start()
+        self.zoom_changed.emit(self.zoom_factor)
 
     def wheelEvent(self, event):
         """Handle mouse wheel events for zooming"""
-        try:
-            if event.modifiers() == Qt.KeyboardModifier.ControlModifier:
-                delta = event.angleDelta().y()
-                zoom_step = 0.1
-                
-                if delta > 0:
-                    self.zoom_factor += zoom_step
-                else:
-                    self.zoom_factor -= zoom_step
-                    
-                # Clamp zoom factor
-                self.zoom_factor = max(0.25, min(self.zoom_factor, 5.0))
-                
-                # Apply and save zoom
-                self.setZoomFactor(self.zoom_factor)
-                config.set_config_value("zoom_factor", self.zoom_factor)
-                self.zoom_changed.emit(self.zoom_factor)
-                
-                event.accept()
-            else:
-                super().wheelEvent(event)
-        except Exception as e:
-            print(f"Error in wheelEvent: {e}")
+        if event.modifiers() == Qt.KeyboardModifier.ControlModifier:
+            zoom_step = 0.1 if event.angleDelta().y() > 0 else -0.1
+            self.set_zoom(self.zoom_factor + zoom_step)
+            event.accept()
+        else:
             super().wheelEvent(event)
 
     def keyPressEvent(self, event):
         """Handle keyboard shortcuts"""
-        try:
-            if event.modifiers() == Qt.KeyboardModifier.ControlModifier:
-                if event.key() == Qt.Key.Key_0:
-                    # Ctrl+0: Reset zoom to 100%
-                    self.zoom_factor = 1.0
-                    self.setZoomFactor(self.zoom_factor)
-                    config.set_config_value("zoom_factor", self.zoom_factor)
-                    self.zoom_changed.emit(self.zoom_factor)
-                    event.accept()
-                    return
-                elif event.key() == Qt.Key.Key_Plus or event.key() == Qt.Key.Key_Equal:
-                    # Ctrl++: Zoom in
-                    self.zoom_factor = min(self.zoom_factor + 0.1, 5.0)
-                    self.setZoomFactor(self.zoom_factor)
-                    config.set_config_value("zoom_factor", self.zoom_factor)
-                    self.zoom_changed.emit(self.zoom_factor)
-                    event.accept()
-                    return
-                elif event.key() == Qt.Key.Key_Minus:
-                    # Ctrl+-: Zoom out
-                    self.zoom_factor = max(self.zoom_factor - 0.1, 0.25)
-                    self.setZoomFactor(self.zoom_factor)
-                    config.set_config_value("zoom_factor", self.zoom_factor)
-                    self.zoom_changed.emit(self.zoom_factor)
-                    event.accept()
-                    return
-            
-            super().keyPressEvent(event)
-        except Exception as e:
-            print(f"Error in keyPressEvent: {e}")
-            super().keyPressEvent(event)
+        if event.modifiers() == Qt.KeyboardModifier.ControlModifier:
+            key = event.key()
+            if key == Qt.Key.Key_0:
+                # Ctrl+0: Reset zoom to 100%
+                self.reset_zoom()
+                event.accept()
+                return
+            elif key == Qt.Key.Key_Plus or key == Qt.Key.Key_Equal:
+                # Ctrl++: Zoom in
+                self.zoom_in()
+                event.accept()
+                return
+            elif key == Qt.Key.Key_Minus:
+                # Ctrl+-: Zoom out
+                self.zoom_out()
+                event.accept()
+                return
+        
+        super().keyPressEvent(event)
 
     def reset_zoom(self):
         """Reset zoom to 100%"""
-        try:
-            self.zoom_factor = 1.0
-            self.setZoomFactor(self.zoom_factor)
-            config.set_config_value("zoom_factor", self.zoom_factor)
-            self.zoom_changed.emit(self.zoom_factor)
-        except Exception as e:
-            print(f"Error resetting zoom: {e}")
+        self.set_zoom(1.0)
 
     def zoom_in(self):
         """Zoom in by one step"""
-        try:
-            self.zoom_factor = min(self.zoom_factor + 0.1, 5.0)
-            self.setZoomFactor(self.zoom_factor)
-            config.set_config_value("zoom_factor", self.zoom_factor)
-            self.zoom_changed.emit(self.zoom_factor)
-        except Exception as e:
-            print(f"Error zooming in: {e}")
+        self.set_zoom(self.zoom_factor + 0.1)
 
     def zoom_out(self):
         """Zoom out by one step"""
+        self.set_zoom(self.zoom_factor - 0.1)
+
+    def save_zoom_factor(self):
+        """Persist the current zoom factor"""
         try:
-            self.zoom_factor = max(self.zoom_factor - 0.1, 0.25)
-            self.setZoomFactor(self.zoom_factor)
             config.set_config_value("zoom_factor", self.zoom_factor)
-            self.zoom_changed.emit(self.zoom_factor)
-        except Exception as e:  # FIXED: Added 'as e' here
-            print(f"Error zooming out: {e}")
+        except Exception as e:
+            print(f"Error saving zoom factor: {e}")
 
     def get_zoom_percentage(self):
         """Get current zoom as percentage string"""
@@ -208,7 +277,7 @@ class GameViewWidget(QWebEngineView):
 
     def cleanup_cache_files(self):
         """Light cleanup - preserve persistent login data"""
-        print("Game view cleanup: Preserving login data and cookies")
+        log.debug("Game view cleanup: Preserving login data and cookies")
         # Don't delete persistent storage directories
         # They contain login sessions and should survive restarts
 
@@ -216,9 +285,15 @@ class GameViewWidget(QWebEngineView):
         """Clean up when widget is closed - preserve login data"""
         if hasattr(self, 'cleanup_timer'):
             self.cleanup_timer.stop()
+        self.cleanup_pending = False
+        
+        # Flush a zoom change that is still waiting on the debounce timer
+        if self.zoom_save_timer.isActive():
+            self.zoom_save_timer.stop()
+            self.save_zoom_factor()
             
-        # Don't clear persistent storage - just clean up memory
-        gc.collect()
-        print("Game view closed - login data preserved")
+        # Don't clear persistent storage. Released objects are freed by
+        # refcounting; the generational collector handles any cycles.
+        log.debug("Game view closed - login data preserved")
         
         super().closeEvent(event)
@@ -1,18 +1,78 @@
 #!/usr/bin/env python3
 # main.py - Updated with custom TTF font support and readable scaling
+import gc
 import sys
 import traceback
 import os
-import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from PyQt6.QtWidgets import QApplication, QMessageBox
-from PyQt6.QtCore import Qt, QDir, QStandardPaths
-from PyQt6.QtGui import QFont, QIcon
+from PyQt6.QtCore import Qt, QDir, QObject, QStandardPaths, QTimer, QThreadPool
+from PyQt6.QtGui import QFont
 
 # Import your main window class
 from main_window import MainWindow
+from game_view import prepare_game_storage
 import config
 from font_loader import font_loader, initialize_fonts
 
+# Longest time exit waits for the final save and temp cleanup
+SHUTDOWN_TIMEOUT_MS = 2000
+
+# Qt 5 HiDPI attributes - Qt 6 scales by default and no longer defines them
+_AA_HIDPI = getattr(Qt.ApplicationAttribute, 'AA_EnableHighDpiScaling', None)
+_AA_PIXMAPS = getattr(Qt.ApplicationAttribute, 'AA_UseHighDpiPixmaps', None)
+
+class GCThresholdTuner(QObject):
+    """Adapt GC thresholds to the current allocation rate.
+
+    Page loads allocate bursts of wrapper objects and then go quiet, so a
+    static threshold either collects constantly during loads or lets gen0
+    grow while idle. Once a second the allocation rate is estimated from
+    gen0 collections and the thresholds switch between two profiles.
+    """
+    BUSY_THRESHOLDS = (5000, 20, 20)  # Defer collection during bursts
+    IDLE_THRESHOLDS = (500, 10, 10)   # Collect eagerly while quiet
+    BUSY_ALLOCATION_RATE = 5000       # Net allocations per second
+    
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.last_collections = self.gen0_collections()
+        self.thresholds = self.IDLE_THRESHOLDS
+        gc.set_threshold(*self.thresholds)
+        
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.timer.timeout.connect(self.sample)
+        self.timer.start(1000)
+    
+    def gen0_collections(self):
+        return gc.get_stats()[0]["collections"]
+    
+    def sample(self):
+        """Estimate allocations since the last sample and retune"""
+        collections = self.gen0_collections()
+        allocations = (collections - self.last_collections) * gc.get_threshold()[0]
+        allocations += gc.get_count()[0]
+        self.last_collections = collections
+        
+        if allocations >= self.BUSY_ALLOCATION_RATE:
+            thresholds = self.BUSY_THRESHOLDS
+        else:
+            thresholds = self.IDLE_THRESHOLDS
+        
+        if thresholds != self.thresholds:
+            self.thresholds = thresholds
+            gc.set_threshold(*thresholds)
+
+def final_config_save():
+    """Write the cached config to disk one last time"""
+    try:
+        config.force_save_config()
+        print("Final config save completed")
+    except Exception as e:
+        print(f"Error in final config save: {e}")
+
 def cleanup_temp_files():
     """Clean up only temporary cache files, preserve persistent data"""
     try:
@@ -21,26 +81,52 @@ def cleanup_temp_files():
         
         temp_dir = tempfile.gettempdir()
         # Only clean up truly temporary files, not persistent data
-        temp_patterns = [
+        temp_prefixes = (
             "lostkit_temp_",
             "lostkit_tmp_",
-        ]
+        )
         
-        for pattern in temp_patterns:
-            for item in os.listdir(temp_dir):
-                if item.startswith(pattern):
-                    item_path = os.path.join(temp_dir, item)
+        # Single directory pass; scandir entries carry their type, so no extra stat
+        with os.scandir(temp_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(temp_prefixes):
                     try:
-                        if os.path.isdir(item_path):
-                            shutil.rmtree(item_path, ignore_errors=True)
+                        if entry.is_dir(follow_symlinks=False):
+                            shutil.rmtree(entry.path, ignore_errors=True)
                         else:
-                            os.remove(item_path)
-                        print(f"Cleaned up temporary file: {item_path}")
+                            os.remove(entry.path)
+                        print(f"Cleaned up temporary file: {entry.path}")
                     except Exception as e:
-                        print(f"Could not clean temporary file {item_path}: {e}")
+                        print(f"Could not clean temporary file {entry.path}: {e}")
     except Exception as e:
         print(f"Error during temp cleanup: {e}")
 
+def get_font_dirs_key():
+    """Modification times of the font directories - they change whenever a
+    font is installed or removed, which is all the fallback probe depends on"""
+    key = []
+    for path in QStandardPaths.standardLocations(QStandardPaths.StandardLocation.FontsLocation):
+        try:
+            key.append([path, os.stat(path).st_mtime_ns])
+        except OSError:
+            continue
+    return key
+
+def resolve_fallback_font_family():
+    """Find the RuneScape fallback family, reusing the one found on an earlier run"""
+    # The stored result is trusted without any font database probes for as
+    # long as the installed fonts are unchanged
+    fonts_key = get_font_dirs_key()
+    family = config.get_config_value("fallback_font_family")
+    if family and config.get_config_value("fallback_font_key") == fonts_key:
+        return family
+    
+    family = "RuneScape UF"
+    if not QFont(family, 24).exactMatch():
+        family = "runescape_uf"
+    config.set_config_values({"fallback_font_family": family, "fallback_font_key": fonts_key})
+    return family
+
 def setup_application_paths():
     """Setup proper application data paths"""
     try:
@@ -53,16 +139,12 @@ def setup_application_paths():
         print(f"Cache directory: {cache_dir}")
         print(f"Storage directory: {storage_dir}")
         
-        # Test write permissions
+        # Check write permissions without creating probe files
         for dir_path in [app_data_dir, cache_dir, storage_dir]:
-            test_file = os.path.join(dir_path, "write_test.tmp")
-            try:
-                with open(test_file, 'w') as f:
-                    f.write("test")
-                os.remove(test_file)
+            if os.access(dir_path, os.W_OK):
                 print(f"Write access confirmed for: {dir_path}")
-            except Exception as e:
-                print(f"Warning: Write access issue for {dir_path}: {e}")
+            else:
+                print(f"Warning: Write access issue for {dir_path}")
             
     except Exception as e:
         print(f"Warning: Could not setup application paths: {e}")
@@ -74,23 +156,14 @@ def main():
         os.chdir(script_dir)
         print(f"Working directory: {script_dir}")
         
-        # Setup application paths and persistent storage
-        setup_application_paths()
-        
-        # Register cleanup function (only for temp files, not persistent data)
-        atexit.register(cleanup_temp_files)
-        
         # Create QApplication instance
         app = QApplication(sys.argv)
         
         # Enable high DPI support
-        try:
-            if hasattr(Qt.ApplicationAttribute, 'AA_EnableHighDpiScaling'):
-                app.setAttribute(Qt.ApplicationAttribute.AA_EnableHighDpiScaling, True)
-            if hasattr(Qt.ApplicationAttribute, 'AA_UseHighDpiPixmaps'):
-                app.setAttribute(Qt.ApplicationAttribute.AA_UseHighDpiPixmaps, True)
-        except AttributeError:
-            pass
+        if _AA_HIDPI is not None:
+            app.setAttribute(_AA_HIDPI, True)
+        if _AA_PIXMAPS is not None:
+            app.setAttribute(_AA_PIXMAPS, True)
         
         # Set application properties
         app.setApplicationName("LostKit")
@@ -98,8 +171,19 @@ def main():
         app.setOrganizationName("LostKit")
         app.setApplicationDisplayName("LostKit")
         
+        # Setup application paths and persistent storage - only once the
+        # application is named, since the data location is derived from it
+        setup_application_paths()
+        
         app.setQuitOnLastWindowClosed(True)
         
+        # Read and validate the config file and create the game's profile
+        # directories on a worker thread while the fonts are registered (font
+        # database and QWebEngineProfile work must stay on this thread)
+        config_loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="config")
+        config_future = config_loader.submit(config.load_config)
+        storage_future = config_loader.submit(prepare_game_storage)
+        
         # Initialize custom font system FIRST
         print("Loading custom fonts...")
         font_loaded = initialize_fonts()
@@ -113,9 +197,7 @@ def main():
             # Fallback to existing system - also readable 1.7x size
             print("Custom font not available, using fallback system")
             try:
-                font = QFont("RuneScape UF", 24)  # 14 * 1.7 = ~24
-                if not font.exactMatch():
-                    font = QFont("runescape_uf", 24)  # 14 * 1.7 = ~24
+                font = QFont(resolve_fallback_font_family(), 24)  # 14 * 1.7 = ~24
                 app.setFont(font)
                 print("RuneScape font fallback loaded successfully with 1.7x scaling")
             except Exception as font_error:
@@ -125,39 +207,55 @@ def main():
         
         # Initialize config system
         print("Initializing configuration system...")
-        initial_config = config.load_config()
+        initial_config = config_future.result()
+        try:
+            storage_future.result()
+        except OSError as e:
+            # GameViewWidget retries and reports the failure itself
+            print(f"Warning: Could not prepare game storage: {e}")
+        config_loader.shutdown()
         print(f"Config loaded from: {config.CONFIG_FILE}")
         print(f"Config contains {len(initial_config)} settings")
         
-        # Create and show main window
+        # Create and show main window. GC is paused for the construction
+        # burst and runs once afterwards; whatever survives that lives for
+        # the whole session, so it is frozen out of later collections. This
+        # is the only place the process freezes objects.
         print("Creating main window...")
-        main_window = MainWindow()
-        main_window.setWindowIcon(QIcon("icon.ico"))
+        gc.disable()
+        try:
+            main_window = MainWindow()
+        finally:
+            gc.enable()
+            gc.collect()
+            gc.freeze()
         main_window.show()
         print("Main window created and shown")
         
-        # Optimize garbage collection
-        import gc
-        gc.set_threshold(700, 10, 10)
+        # Adapt garbage collection thresholds to the allocation rate. The
+        # tuner is parented to the application, which keeps it alive.
+        GCThresholdTuner(app)
         
         font_status = "custom TTF font" if font_loaded else "fallback fonts"
         print(f"LostKit started successfully with {font_status}")
         print("Your settings, cookies, and login data will be preserved between restarts")
         
+        # Clear temp files left by earlier sessions in the background
+        # (only temp files, never persistent data)
+        threading.Thread(target=cleanup_temp_files, daemon=True).start()
+        
         # Start the application event loop
         exit_code = app.exec()
         
         print("Application shutting down...")
         
-        # Final config save
-        try:
-            config.force_save_config()
-            print("Final config save completed")
-        except Exception as e:
-            print(f"Error in final config save: {e}")
-        
-        # Clean up only temporary files
-        cleanup_temp_files()
+        # Final config save and temp cleanup run side by side on the thread
+        # pool; exit waits for both, but never longer than the deadline
+        thread_pool = QThreadPool.globalInstance()
+        thread_pool.start(final_config_save)
+        thread_pool.start(cleanup_temp_files)
+        if not thread_pool.waitForDone(SHUTDOWN_TIMEOUT_MS):
+            print("Shutdown tasks did not finish in time")
         
         sys.exit(exit_code)
         
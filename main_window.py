@@ -1,23 +1,62 @@
 # main_window.py
-import gc
+import logging
 import time
 import uuid
 import re
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QHBoxLayout, QSplitter, 
                              QVBoxLayout, QTabWidget, QPushButton, QLabel)
-from PyQt6.QtCore import Qt, QTimer, QUrl
-from PyQt6.QtGui import QFont, QIcon, QPixmap, QPalette, QBrush, QColor
-from game_view import GameViewWidget
+from PyQt6.QtCore import Qt, QTimer, QPoint
+from PyQt6.QtGui import QPixmap, QPalette, QBrush, QColor, QGuiApplication
+from PyQt6.QtWebEngineWidgets import QWebEngineView
+from game_view import GameViewWidget, resolve_url
 from right_panel import RightToolsPanel, InGameBrowser
 from chat_panel import ChatPanel
-from world_switcher import WorldSwitcherWindow
+from world_switcher import WorldSwitcherWindow, preload_flag_icons
 import config
-from styles import get_main_stylesheet, get_icon_path
+from styles import get_main_stylesheet, get_app_icon, get_icon, get_icon_path
 from font_loader import font_loader
-import os
+
+log = logging.getLogger(__name__)
+
+# Longest a window state change waits for its save during continuous activity
+MAX_SAVE_DELAY_MS = 5000
+
+# Shortest gap between config save restarts while the window is dragged
+MOVE_SAVE_INTERVAL = 0.1
+
+# World number in game URLs, e.g. ...?world=3 or /world:3
+_WORLD_RE = re.compile(r'world[=:](\d+)', re.IGNORECASE)
+
+
+# Map world numbers to locations (from WORLDS_CONFIG)
+_LOCATION_MAP = {
+    '1': 'US',
+    '2': 'US',
+    '3': 'Finland',
+    '4': 'Finland',
+    '9': 'Australia',
+    '11': 'Japan',
+    '13': 'US',
+    '15': 'US',
+    '17': 'Singapore',
+}
 
 
 class MainWindow(QMainWindow):
+    # Config keys owned by the main window; everything else is written by
+    # the panel that owns it and must not be overwritten from self.config
+    WINDOW_STATE_KEYS = (
+        "window_geometry",
+        "chat_panel_height",
+        "right_panel_width",
+        "zoom_factor",
+        "chat_zoom_factor",
+        "chat_panel_visible",
+        "right_panel_collapsed",
+        "last_world_url",
+        "last_world_info",
+    )
+    
     def __init__(self):
         super().__init__()
         
@@ -27,14 +66,18 @@ class MainWindow(QMainWindow):
         self.setWindowTitle(f"LostKit")
         
         # Set window icon if it exists
-        if os.path.exists("icon.ico"):
-            self.setWindowIcon(QIcon("icon.ico"))
+        app_icon = get_app_icon()
+        if app_icon is not None:
+            self.setWindowIcon(app_icon)
         
         # Load config - ensure proper restoration
         self.config = config.load_config()
         
-        # Window state management
+        # Window state management - changes mark the config dirty and are
+        # written once resize_timer settles
         self.is_closing = False
+        self.config_dirty = False
+        self.last_move_time = 0.0
         self.resize_timer = QTimer(self)
         self.resize_timer.setSingleShot(True)
         self.resize_timer.timeout.connect(self.save_window_state_debounced)
@@ -47,6 +90,10 @@ class MainWindow(QMainWindow):
         palette.setColor(QPalette.ColorRole.Window, QColor(0, 0, 0))
         self.setPalette(palette)
         
+        # Readable font first, so the stylesheet below resolves fonts once and
+        # every child created afterwards inherits it without a separate pass
+        self.force_apply_readable_fonts()
+        
         # Apply updated stylesheet with custom font
         self.setStyleSheet(get_main_stylesheet())
         
@@ -68,145 +115,104 @@ class MainWindow(QMainWindow):
 
         self.setCentralWidget(central_widget)
         
-        # Track browser tabs for cleanup
+        # Open browser tabs keyed by tool title - also the duplicate check.
+        # Entries are removed explicitly when a tab is closed.
         self.browser_tabs = {}
         
-        # World switcher window
+        # World switcher window, created on first use. Its flag icons are
+        # rendered once startup has settled, off the path that opens it.
         self.world_switcher_window = None
+        QTimer.singleShot(2000, Qt.TimerType.CoarseTimer, preload_flag_icons)
         
-        # Setup resource management
-        self.setup_resource_management()
-
-        # Save config periodically to prevent data loss
-        self.config_save_timer = QTimer(self)
-        self.config_save_timer.timeout.connect(self.periodic_config_save)
-        self.config_save_timer.start(30000)  # Save config every 30 seconds
-        
-        # Apply readable fonts after UI is created
-        QTimer.singleShot(100, self.force_apply_readable_fonts)
+        # Last world parsed from the game URL and the label shown for it;
+        # () means nothing has been parsed yet (None is "no world")
+        self.last_world_key = ()
+        self.world_info_text = None
 
     def force_apply_readable_fonts(self):
-        """Force apply readable fonts to all UI elements after creation"""
-        print("Forcing readable font application...")
-        
-        # Create readable fonts - 1.7x scaling instead of 5x
-        font = QFont()
-        if font_loader.is_custom_font_available():
-            font.setFamily(font_loader.get_font_family_name())
-            print(f"Using custom font: {font_loader.get_font_family_name()}")
-        else:
-            print("Custom font not available, checking for Runescape-Quill-Caps...")
-            # Try to find Runescape-Quill-Caps specifically
-            test_font = QFont("Runescape-Quill-Caps", 20)
-            if test_font.exactMatch():
-                font.setFamily("Runescape-Quill-Caps")
-                print("Found Runescape-Quill-Caps font")
-            else:
-                font.setFamily("Arial")
-                print("Using Arial fallback")
+        """Apply the readable font to the window and everything it contains"""
+        log.debug("Forcing readable font application...")
         
-        font.setPointSize(20)  # Readable size - was 35 before (5x), now ~24 (1.7x)
-        font.setWeight(QFont.Weight.Normal)
+        # Readable size - was 35 before (5x), now ~24 (1.7x). The family
+        # lookup and the font itself are cached by font_loader.
+        font = font_loader.get_ui_font(20)
         
         # Apply to main window and all children recursively
         self.apply_font_to_widget_tree(self, font)
         
-        print(f"Applied {font.pointSize()}pt font ({font.family()}) to all UI elements")
+        log.debug("Applied %dpt font (%s) to all UI elements", font.pointSize(), font.family())
 
     def apply_font_to_widget_tree(self, widget, font):
-        """Recursively apply font to widget and all its children"""
+        """Apply font to a widget; Qt propagates it to every child in one pass"""
+        # Repaint once at the end rather than per widget
+        widget.setUpdatesEnabled(False)
         try:
-            # Apply font to the current widget
             widget.setFont(font)
-            
-            # Special handling for specific widget types
-            if hasattr(widget, 'setText') and hasattr(widget, 'text'):
-                # For buttons, labels, etc - force font update
-                current_text = widget.text()
-                widget.setFont(font)
-                widget.setText(current_text)  # Trigger text refresh
-            
-            # Apply to all child widgets
-            for child in widget.findChildren(QWidget):
-                if not isinstance(child, (QTabWidget,)):  # Skip web views to avoid issues
-                    child.setFont(font)
-                    
-                    # Special handling for tab widgets
-                    if isinstance(child, QTabWidget):
-                        # Apply font to tab bar
-                        tab_bar = child.tabBar()
-                        if tab_bar:
-                            tab_bar.setFont(font)
-                            
+            # Tab bars get it explicitly so tab text always matches
+            for tab_widget in self.find_tab_widgets(widget):
+                tab_widget.tabBar().setFont(font)
         except Exception as e:
-            print(f"Error applying font to widget: {e}")
+            log.error("Error applying font to widget: %s", e)
+        finally:
+            widget.setUpdatesEnabled(True)
+            widget.update()
+
+    def find_tab_widgets(self, widget):
+        """Yield tab widgets below widget without descending into web views,
+        whose Chromium internals hold many widgets and never need our font"""
+        for child in widget.children():
+            if not child.isWidgetType() or isinstance(child, QWebEngineView):
+                continue
+            if isinstance(child, QTabWidget):
+                yield child
+            yield from self.find_tab_widgets(child)
 
     def setup_window_geometry(self):
         """Setup window geometry with proper restoration"""
         try:
             geom = self.config.get("window_geometry")
             if geom and isinstance(geom, list) and len(geom) == 4:
-                x, y, w, h = [int(val) for val in geom]
+                x, y, w, h = map(int, geom)
                 
-                # Validate geometry is on screen
-                x = max(0, min(x, 1920 - w))
-                y = max(0, min(y, 1080 - h))
-                w = max(1000, min(w, 1920))
-                h = max(700, min(h, 1080))
+                # Validate geometry against the screen it was saved on
+                screen = QGuiApplication.screenAt(QPoint(x, y)) or QGuiApplication.primaryScreen()
+                area = screen.availableGeometry()
+                w = max(1000, min(w, area.width()))
+                h = max(700, min(h, area.height()))
+                x = max(area.left(), min(x, area.left() + area.width() - w))
+                y = max(area.top(), min(y, area.top() + area.height() - h))
                 
                 self.setGeometry(x, y, w, h)
-                print(f"Restored window geometry: {w}x{h} at ({x},{y})")
+                log.info("Restored window geometry: %dx%d at (%d,%d)", w, h, x, y)
             else:
                 # Default geometry
                 self.setGeometry(100, 100, 1440, 900)
-                print("Using default window geometry")
+                log.info("Using default window geometry")
         except (ValueError, TypeError) as e:
-            print(f"Error setting window geometry: {e}, using defaults")
+            log.error("Error setting window geometry: %s, using defaults", e)
             self.setGeometry(100, 100, 1440, 900)
 
-    def periodic_config_save(self):
-        """Periodically save config to prevent data loss"""
+    def mark_config_dirty(self):
+        """Schedule a debounced save of the window state"""
         if not self.is_closing:
-            try:
-                self.save_current_state_to_config()
-                config.force_save_config()
-                print("Periodic config save completed")
-            except Exception as e:
-                print(f"Error in periodic config save: {e}")
-
-    def setup_resource_management(self):
-        """Setup periodic resource management"""
-        if config.get_config_value("resource_optimization", True):
-            self.resource_timer = QTimer(self)
-            self.resource_timer.timeout.connect(self.perform_resource_cleanup)
-            self.resource_timer.start(300000)  # 5 minutes
-
-    def perform_resource_cleanup(self):
-        """Perform periodic resource cleanup"""
-        try:
-            if self.is_closing:
-                return
-                
-            gc.collect()
-            
-            # Clean up dead browser tab references
-            dead_tabs = []
-            for tab_index, browser in list(self.browser_tabs.items()):
-                try:
-                    if not hasattr(browser, 'isVisible') or not browser.parent():
-                        dead_tabs.append(tab_index)
-                except RuntimeError:
-                    dead_tabs.append(tab_index)
-            
-            for tab_index in dead_tabs:
-                if tab_index in self.browser_tabs:
-                    del self.browser_tabs[tab_index]
-            
-            if dead_tabs:
-                print(f"Cleaned up {len(dead_tabs)} dead browser tab references")
-                
-        except Exception as e:
-            print(f"Error during resource cleanup: {e}")
+            if not self.config_dirty:
+                # Cap the delay while changes keep restarting resize_timer
+                QTimer.singleShot(MAX_SAVE_DELAY_MS, self.save_window_state_debounced)
+            self.config_dirty = True
+            self.resize_timer.start(1000)
+
+    def push_window_state(self):
+        """Hand the window-owned config keys to the config module"""
+        config.set_config_values({key: self.config[key]
+                                  for key in self.WINDOW_STATE_KEYS if key in self.config})
+        self.config_dirty = False
+
+    def forget_browser_tab(self, browser):
+        """Drop the tracking entry of a closing browser tab right away, before
+        its deferred deletion, so reopening the tool creates a fresh tab"""
+        title = getattr(browser, 'title', None)
+        if self.browser_tabs.get(title) is browser:
+            del self.browser_tabs[title]
 
     def create_left_section(self):
         """Create the left section with game view and chat panel"""
@@ -221,31 +227,38 @@ class MainWindow(QMainWindow):
         # Create game section
         self.create_game_section()
         
-        # Create chat panel - NOTE: Chat panel uses its own font system (external IRC)
-        self.chat_panel = ChatPanel()
-        self.chat_panel.instance_id = self.instance_id
-        print("Chat panel created with original font system (external IRC)")
-        
         # Add to vertical splitter
         self.left_vertical_splitter.addWidget(self.game_widget)
-        self.left_vertical_splitter.addWidget(self.chat_panel)
+        
+        # Create chat panel - NOTE: Chat panel uses its own font system (external IRC).
+        # A chat hidden last session is only built (and connected) once it is
+        # shown; until then an empty placeholder holds its splitter slot.
+        self.chat_panel = None
+        if self.config.get("chat_panel_visible", True):
+            self.left_vertical_splitter.addWidget(self.create_chat_panel())
+        else:
+            placeholder = QWidget()
+            placeholder.hide()
+            self.left_vertical_splitter.addWidget(placeholder)
         
         # Restore vertical splitter sizes
         game_height = 600
         chat_height = self.config.get("chat_panel_height", 200)
         self.left_vertical_splitter.setSizes([game_height, chat_height])
         
-        # Restore chat panel visibility
-        chat_visible = self.config.get("chat_panel_visible", True)
-        if not chat_visible:
-            self.chat_panel.hide()
-        
         # Connect splitter moved signal
         self.left_vertical_splitter.splitterMoved.connect(self.on_vertical_splitter_moved)
         
         left_layout.addWidget(self.left_vertical_splitter)
         self.main_horizontal_splitter.addWidget(self.left_widget)
 
+    def create_chat_panel(self):
+        """Build the chat panel"""
+        self.chat_panel = ChatPanel()
+        self.chat_panel.instance_id = self.instance_id
+        log.debug("Chat panel created with original font system (external IRC)")
+        return self.chat_panel
+
     def create_game_section(self):
         """Create the main game section with tabs - starts with detail page loaded"""
         self.game_widget = QWidget()
@@ -288,7 +301,7 @@ class MainWindow(QMainWindow):
         
         # Game view tab - Start with detail page loaded
         game_url = "https://2004.lostcity.rs/detail"
-        print(f"Starting with detail page: {game_url}")
+        log.info("Starting with detail page: %s", game_url)
         
         self.game_view = GameViewWidget(game_url)
         self.game_view.instance_id = self.instance_id
@@ -306,9 +319,8 @@ class MainWindow(QMainWindow):
         tab_index = self.tab_widget.addTab(self.game_view, "Lost City")
         
         # Set icon if available
-        if os.path.exists(lost_city_icon_path) and lost_city_icon_path.endswith('.png'):
-            icon = QIcon(lost_city_icon_path)
-            self.tab_widget.setTabIcon(tab_index, icon)
+        if lost_city_icon_path.endswith('.png'):
+            self.tab_widget.setTabIcon(tab_index, get_icon(lost_city_icon_path))
         
         # Make game tab unclosable
         self.tab_widget.tabBar().setTabButton(0, self.tab_widget.tabBar().ButtonPosition.RightSide, None)
@@ -352,7 +364,17 @@ class MainWindow(QMainWindow):
 
     def toggle_chat_panel(self):
         """Toggle visibility of chat panel"""
-        if self.chat_panel.isVisible():
+        if self.chat_panel is None:
+            # First show of a chat that started hidden - swap out the placeholder
+            placeholder = self.left_vertical_splitter.widget(1)
+            self.left_vertical_splitter.replaceWidget(1, self.create_chat_panel())
+            placeholder.deleteLater()
+            self.chat_panel.show()
+            chat_height = self.config.get("chat_panel_height", 200)
+            total_height = sum(self.left_vertical_splitter.sizes())
+            self.left_vertical_splitter.setSizes([total_height - chat_height, chat_height])
+            self.config["chat_panel_visible"] = True
+        elif self.chat_panel.isVisible():
             self.chat_panel.hide()
             self.config["chat_panel_visible"] = False
         else:
@@ -362,26 +384,27 @@ class MainWindow(QMainWindow):
         # Update the right panel button color
         self.tools_panel.update_chat_button_style(self.config["chat_panel_visible"])
         
-        # Save immediately
-        config.save_config(self.config)
+        self.mark_config_dirty()
 
     def open_browser_tab(self, url, title):
         """Open a tool in a new tab within the main window"""
-        print(f"Opening browser tab: {title} - {url}")
+        log.debug("Opening browser tab: %s - %s", title, url)
         
-        icon_path = get_icon_path(title)
+        # Check if tab already exists
+        existing = self.browser_tabs.get(title)
+        if existing is not None:
+            self.tab_widget.setCurrentWidget(existing)
+            return
         
-        if os.path.exists(icon_path) and icon_path.endswith('.png'):
+        # PNG icon when bundled, otherwise get_icon_path's emoji goes in the title
+        icon_path = get_icon_path(title)
+        if icon_path.endswith('.png'):
+            icon = get_icon(icon_path)
             tab_title = title
         else:
+            icon = None
             tab_title = f"{icon_path} {title}"
         
-        # Check if tab already exists
-        for i in range(self.tab_widget.count()):
-            if self.tab_widget.tabText(i) == tab_title or self.tab_widget.tabText(i) == f"{icon_path} {title}":
-                self.tab_widget.setCurrentIndex(i)
-                return
-        
         try:
             if '?' in url:
                 unique_url = f"{url}&instance={self.instance_id}"
@@ -391,17 +414,16 @@ class MainWindow(QMainWindow):
             browser = InGameBrowser(unique_url, title)
             browser.closed.connect(lambda: self.close_browser_by_widget(browser))
             
-            tab_index = self.tab_widget.addTab(browser, tab_title)
-            
-            if os.path.exists(icon_path) and icon_path.endswith('.png'):
-                icon = QIcon(icon_path)
-                self.tab_widget.setTabIcon(tab_index, icon)
+            if icon is not None:
+                tab_index = self.tab_widget.addTab(browser, icon, tab_title)
+            else:
+                tab_index = self.tab_widget.addTab(browser, tab_title)
             
             self.tab_widget.setCurrentIndex(tab_index)
-            self.browser_tabs[tab_index] = browser
+            self.browser_tabs[title] = browser
             
         except Exception as e:
-            print(f"Error creating browser tab: {e}")
+            log.error("Error creating browser tab: %s", e)
 
     def close_browser_tab(self, index):
         """Close a browser tab with proper cleanup"""
@@ -414,23 +436,18 @@ class MainWindow(QMainWindow):
                 try:
                     widget.cleanup_cache_files()
                 except Exception as e:
-                    print(f"Error cleaning up browser tab cache: {e}")
+                    log.error("Error cleaning up browser tab cache: %s", e)
             
-            if index in self.browser_tabs:
-                del self.browser_tabs[index]
+            self.forget_browser_tab(widget)
             
             self.tab_widget.removeTab(index)
             widget.deleteLater()
-            
-            if config.get_config_value("resource_optimization", True):
-                gc.collect()
 
     def close_browser_by_widget(self, browser_widget):
         """Close browser tab by widget reference"""
-        for i in range(self.tab_widget.count()):
-            if self.tab_widget.widget(i) == browser_widget:
-                self.close_browser_tab(i)
-                break
+        index = self.tab_widget.indexOf(browser_widget)
+        if index != -1:
+            self.close_browser_tab(index)
     
     def open_world_switcher(self):
         """Open or focus the world switcher window"""
@@ -452,72 +469,79 @@ class MainWindow(QMainWindow):
     
     def on_world_selected(self, world_url, world_info, is_high_detail):
         """Handle world selection from world switcher"""
-        print(f"Switching to: {world_info}")
-        print(f"URL: {world_url}")
-        print(f"High Detail: {is_high_detail}")
+        log.info("Switching to: %s", world_info)
+        log.debug("URL: %s, high detail: %s", world_url, is_high_detail)
         
         # Load the new world in the game view
-        self.game_view.setUrl(QUrl(world_url))
+        self.game_view.setUrl(resolve_url(world_url))
         
         # Update world info display in right panel
-        self.tools_panel.update_world_info(world_info)
+        self.set_world_info_text(world_info)
         
         # Save the selected world to config
-        config.set_config_value("last_world_url", world_url)
-        config.set_config_value("last_world_info", world_info)
+        self.config.update(last_world_url=world_url, last_world_info=world_info)
+        self.mark_config_dirty()
     
-    def update_world_info_from_url(self, url):
-        """Update world info display by parsing the URL - ONLY show world info for recognized worlds"""
-        url_string = url if isinstance(url, str) else url.toString()
-        
+    def parse_world_key(self, url_string):
+        """Get (world number, high detail) from a game URL, or None"""
         # Extract world number
-        world_match = re.search(r'world[=:](\d+)', url_string, re.IGNORECASE)
+        world_match = _WORLD_RE.search(url_string)
         if not world_match:
-            self.tools_panel.update_world_info("No world")
-            return
-        
-        world_num = world_match.group(1)
+            return None
         
         # Extract detail mode
-        is_high_detail = 'detail=high' in url_string.lower()
-        is_low_detail = 'detail=low' in url_string.lower()
+        url_lower = url_string.lower()
+        is_high_detail = 'detail=high' in url_lower
+        is_low_detail = 'detail=low' in url_lower
         
-        # Only show world info if we have both a world number and detail mode
+        # Only recognized worlds have both a world number and detail mode
         if not is_high_detail and not is_low_detail:
-            self.tools_panel.update_world_info("No world")
-            return
+            return None
         
+        return world_match.group(1), is_high_detail
+
+    def set_world_info_text(self, world_info):
+        """Update the right panel world label only when its text changes"""
+        if world_info != self.world_info_text:
+            self.world_info_text = world_info
+            self.tools_panel.update_world_info(world_info)
+
+    def update_world_info_from_url(self, url):
+        """Update world info display by parsing the URL - ONLY show world info for recognized worlds.
+        Returns False when the world and detail mode are unchanged."""
+        url_string = url if isinstance(url, str) else url.toString()
+        
+        world_key = self.parse_world_key(url_string)
+        if world_key == self.last_world_key:
+            return False
+        self.last_world_key = world_key
+        
+        if world_key is None:
+            self.set_world_info_text("No world")
+            return True
+        
+        world_num, is_high_detail = world_key
         detail_text = "HD" if is_high_detail else "LD"
         
-        # Map world numbers to locations (from WORLDS_CONFIG)
-        location_map = {
-            '1': 'US',
-            '2': 'US',
-            '3': 'Finland',
-            '4': 'Finland',
-            '9': 'Australia',
-            '11': 'Japan',
-            '13': 'US',
-            '15': 'US',
-            '17': 'Singapore',
-        }
-        
-        location = location_map.get(world_num, 'Unknown')
+        location = _LOCATION_MAP.get(world_num, 'Unknown')
         world_info = f"W{world_num} {location} ({detail_text})"
         
-        self.tools_panel.update_world_info(world_info)
+        self.set_world_info_text(world_info)
         
         # Save to config
-        config.set_config_value("last_world_url", url_string)
-        config.set_config_value("last_world_info", world_info)
+        self.config.update(last_world_url=url_string, last_world_info=world_info)
+        self.mark_config_dirty()
+        return True
     
     def on_game_url_changed(self, url):
         """Handle game view URL changes"""
         url_string = url.toString()
-        print(f"Game URL changed: {url_string}")
+        log.debug("Game URL changed: %s", url_string)
         
-        # Update world info display from URL
-        self.update_world_info_from_url(url_string)
+        # Update world info display from URL; navigation within the same
+        # world (login flow, in-page requests) stops here
+        if not self.update_world_info_from_url(url_string):
+            return
         
         # Update world switcher if it's open
         if self.world_switcher_window:
@@ -525,8 +549,7 @@ class MainWindow(QMainWindow):
 
     def on_vertical_splitter_moved(self, pos, index):
         """Save vertical splitter position to config"""
-        if not self.is_closing:
-            self.resize_timer.start(1000)  # Save after 1 second of no movement
+        self.mark_config_dirty()  # Save after 1 second of no movement
 
     def on_horizontal_splitter_moved(self, pos, index):
         """Handle horizontal splitter movement"""
@@ -535,34 +558,32 @@ class MainWindow(QMainWindow):
             if len(sizes) >= 2:
                 right_width = sizes[1]
                 
-                # If panel is dragged to very small width, collapse it
-                if right_width < 50:
-                    self.tools_panel.set_collapsed_state(True)
-                    total_width = self.main_horizontal_splitter.width()
-                    self.main_horizontal_splitter.setSizes([total_width - 25, 25])
-                elif right_width >= 50 and self.tools_panel.collapsed:
-                    # Panel is being expanded
-                    self.tools_panel.set_collapsed_state(False)
-                    panel_width = self.config.get("right_panel_width", 250)
+                # Only re-layout when the drag crosses the collapse threshold
+                collapse = right_width < 50
+                if collapse != self.tools_panel.collapsed:
+                    self.tools_panel.set_collapsed_state(collapse)
+                    if collapse:
+                        panel_width = 25
+                    else:
+                        panel_width = self.config.get("right_panel_width", 250)
                     total_width = self.main_horizontal_splitter.width()
                     self.main_horizontal_splitter.setSizes([total_width - panel_width, panel_width])
-                else:
-                    # Save the panel width when not collapsed
-                    if not self.tools_panel.collapsed:
-                        self.config["right_panel_width"] = right_width
+                elif not collapse:
+                    # Keep the in-memory width current - resizeEvent and
+                    # re-expanding restore it before the debounced save runs
+                    self.config["right_panel_width"] = right_width
                 
-                self.resize_timer.start(1000)
+                self.mark_config_dirty()
 
     def save_current_state_to_config(self):
         """Save current window state to config"""
         try:
             # Save window geometry
-            geom = self.geometry()
-            self.config["window_geometry"] = [geom.x(), geom.y(), geom.width(), geom.height()]
+            self.config["window_geometry"] = list(self.geometry().getRect())
             
             # Save vertical splitter sizes  
             v_sizes = self.left_vertical_splitter.sizes()
-            if len(v_sizes) >= 2:
+            if len(v_sizes) >= 2 and v_sizes[1] > 0:
                 self.config["chat_panel_height"] = v_sizes[1]
             
             # Save horizontal splitter state
@@ -578,47 +599,53 @@ class MainWindow(QMainWindow):
                 self.config["chat_zoom_factor"] = self.chat_panel.chat_zoom_factor
             
             # Save panel states
-            self.config["chat_panel_visible"] = self.chat_panel.isVisible()
+            self.config["chat_panel_visible"] = self.chat_panel is not None and self.chat_panel.isVisible()
             self.config["right_panel_collapsed"] = self.tools_panel.collapsed
             
         except Exception as e:
-            print(f"Error saving current state: {e}")
+            log.error("Error saving current state: %s", e)
 
     def save_window_state_debounced(self):
         """Save window state after debouncing timer expires"""
-        if self.is_closing:
+        if self.is_closing or not self.config_dirty:
             return
             
         try:
             self.save_current_state_to_config()
-            config.save_config(self.config)
-            print("Window state saved to config")
+            self.push_window_state()
+            log.debug("Window state saved to config")
         except Exception as e:
-            print(f"Error saving window state: {e}")
+            log.error("Error saving window state: %s", e)
 
     def moveEvent(self, event):
         """Handle window move with debounced saving"""
         super().moveEvent(event)
-        if not self.is_closing:
-            self.resize_timer.start(1000)
+        if event.oldPos() == event.pos():
+            return
+        # A drag delivers a move per mouse event; restarting the save timer
+        # a few times per second is plenty
+        now = time.monotonic()
+        if now - self.last_move_time >= MOVE_SAVE_INTERVAL:
+            self.last_move_time = now
+            self.mark_config_dirty()
 
     def resizeEvent(self, event):
         """Handle window resize with proper panel width maintenance"""
         super().resizeEvent(event)
         if not self.is_closing:
-            # Maintain panel widths on window resize
+            # Maintain panel widths on window resize - only touch the
+            # splitter when the panel actually drifted from its width
             if hasattr(self, 'tools_panel'):
                 if self.tools_panel.collapsed:
-                    total_width = self.width()
-                    left_width = total_width - 25
-                    self.main_horizontal_splitter.setSizes([left_width, 25])
+                    panel_width = 25
                 else:
-                    total_width = self.width()
                     panel_width = self.config.get("right_panel_width", 250)
-                    left_width = total_width - panel_width
+                sizes = self.main_horizontal_splitter.sizes()
+                if len(sizes) < 2 or sizes[1] != panel_width:
+                    left_width = self.width() - panel_width
                     self.main_horizontal_splitter.setSizes([left_width, panel_width])
             
-            self.resize_timer.start(1000)
+            self.mark_config_dirty()
 
     def closeEvent(self, event):
         """Save window state when closing with comprehensive cleanup"""
@@ -626,31 +653,29 @@ class MainWindow(QMainWindow):
         
         try:
             # Stop all timers
-            if hasattr(self, 'resource_timer'):
-                self.resource_timer.stop()
             if hasattr(self, 'resize_timer'):
                 self.resize_timer.stop()
-            if hasattr(self, 'config_save_timer'):
-                self.config_save_timer.stop()
             
             # Save final state
             self.save_current_state_to_config()
-            config.save_config(self.config)
-            print("Final config save completed")
+            self.push_window_state()
+            config.force_save_config()
+            log.info("Final config save completed")
             
-            # Close all browser tabs
+            # Tear down browser tabs in one go - deleting a page drops its tab,
+            # so there is no per-tab removeTab relayout on the way out
             for i in range(self.tab_widget.count() - 1, 0, -1):
-                self.close_browser_tab(i)
+                self.tab_widget.widget(i).deleteLater()
+            self.browser_tabs.clear()
             
             # Clean up tools panel
             if hasattr(self.tools_panel, 'close_all_tool_windows'):
                 self.tools_panel.close_all_tool_windows()
             
-            # Final garbage collection
-            gc.collect()
-            print("Application cleanup completed - all settings preserved")
+            # No final collection - the process is exiting and the OS reclaims it all
+            log.info("Application cleanup completed - all settings preserved")
             
         except Exception as e:
-            print(f"Error during window close cleanup: {e}")
+            log.error("Error during window close cleanup: %s", e)
         
         event.accept()
@@ -1,23 +1,319 @@
 # right_panel.py
+import functools
+import logging
 import weakref
-import gc
-import time
-import os
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QPushButton, QGroupBox, 
+from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QPushButton, QGroupBox, 
                              QCheckBox, QScrollArea, QLabel, QMainWindow, QMessageBox, QHBoxLayout)
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 from PyQt6.QtWebEngineCore import QWebEngineProfile, QWebEnginePage, QWebEngineSettings
-from PyQt6.QtCore import QUrl, Qt, pyqtSignal, QTimer, QSize
-from PyQt6.QtGui import QFont, QIcon, QPixmap, QColor, QPalette
+from PyQt6.QtCore import QUrl, Qt, pyqtSignal, QTimer, QSize, QPoint
+from PyQt6.QtGui import QFont, QColor, QPalette, QGuiApplication
 from config import load_config, save_config, get_config_value, set_config_value
-from styles import get_icon_path, get_tool_urls
+from styles import (BUTTON_IMAGE_PATH, get_app_icon, get_icon_path, get_tool_urls,
+                    has_button_image, load_icon_async)
+from tools_profile import get_tools_http_cache
 from font_loader import font_loader
 import config
 
+log = logging.getLogger(__name__)
+
+# Web settings applied when resource_optimization is on, resolved once at import
+_WebAttribute = QWebEngineSettings.WebAttribute
+TOOL_WINDOW_SETTINGS = (
+    (_WebAttribute.AutoLoadImages, True),
+    (_WebAttribute.JavascriptEnabled, True),
+    (_WebAttribute.LocalStorageEnabled, True),
+    (_WebAttribute.PluginsEnabled, False),
+    (_WebAttribute.WebGLEnabled, False),
+    (_WebAttribute.Accelerated2dCanvasEnabled, False),
+)
+INGAME_BROWSER_SETTINGS = TOOL_WINDOW_SETTINGS[:4]
+
+# resource_optimization read once and kept current through config change
+# notifications, so opening a window does not go back to the config
+_resource_optimization = None
+
+
+def _on_config_changed(key, value):
+    global _resource_optimization
+    if key == "resource_optimization":
+        _resource_optimization = bool(value)
+
+
+config.signals.value_changed.connect(_on_config_changed)
+
+
+def get_optimized_settings(table):
+    """Get the web settings to apply from table, or none if optimization is off"""
+    global _resource_optimization
+    if _resource_optimization is None:
+        _resource_optimization = bool(get_config_value("resource_optimization", True))
+    return table if _resource_optimization else ()
+
+
+# Shorter button labels for tool names that do not fit the panel
+TOOL_DISPLAY_NAMES = {
+    "Clue Coordinates": "Coordinates",
+    "Clue Scroll Help": "Clue Help",
+    "Market Prices": "Prices",
+}
+
+GROUP_BOX_STYLE = """
+    QGroupBox {
+        background: #000000;
+        color: #f5e6c0;
+        font-weight: bold;
+        border: 2px solid #2a2a2a;
+        border-radius: 0px;
+        margin: 3px 0px;
+        padding-top: 8px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 8px 0 8px;
+        background-color: #2a2a2a;
+    }
+"""
+
+SCROLL_AREA_STYLE = """
+    QScrollArea {
+        background: #000000;
+        border: 1px solid #2a2a2a;
+    }
+    QScrollBar:vertical {
+        background: #2a2a2a;
+        width: 14px;
+        border: 1px solid #2a2a2a;
+    }
+    QScrollBar::handle:vertical {
+        background: #8b4a4a;
+        min-height: 20px;
+        border-radius: 0px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background: #a55a5a;
+    }
+"""
+
+EXPAND_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #8b4a4a;
+        border: 1px solid #2a2a2a;
+        border-radius: 2px;
+        color: #f5e6c0;
+        font-weight: bold;
+        font-size: 10px;
+    }
+    QPushButton:hover {
+        background-color: #a55a5a;
+    }
+"""
+
+EXTERNAL_CHECKBOX_STYLE = """
+    QCheckBox {
+        color: #f5e6c0;
+        spacing: 8px;
+        background: transparent;
+    }
+    QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+    }
+    QCheckBox::indicator:unchecked {
+        background-color: #4a4a4a;
+        border: 2px solid #2a2a2a;
+        border-radius: 0px;
+    }
+    QCheckBox::indicator:checked {
+        background-color: #8b4a4a;
+        border: 2px solid #2a2a2a;
+        border-radius: 0px;
+    }
+"""
+
+WORLD_SWITCHER_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #8b4a4a;
+        border: 2px solid #2a2a2a;
+        border-radius: 0px;
+        padding: 8px 12px;
+        color: #f5e6c0;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #a55a5a;
+        border-color: #8b4a4a;
+    }
+    QPushButton:pressed {
+        background-color: #8b4a4a;
+        border: 2px inset #2a2a2a;
+    }
+"""
+
+CHAT_BUTTON_ACTIVE_STYLE = """
+    QPushButton {
+        background-color: #4a6a4a;
+        border: 2px solid #2a2a2a;
+        border-radius: 0px;
+        padding: 8px 12px;
+        color: #f5e6c0;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #5a7a5a;
+    }
+"""
+
+CHAT_BUTTON_INACTIVE_STYLE = """
+    QPushButton {
+        background-color: #8b4a4a;
+        border: 2px solid #2a2a2a;
+        border-radius: 0px;
+        padding: 8px 12px;
+        color: #f5e6c0;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #a55a5a;
+    }
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def get_world_label_style():
+    """Build the world info label stylesheet once"""
+    if has_button_image():
+        background = f"background: url({BUTTON_IMAGE_PATH}) center center stretch;"
+    else:
+        background = "background-color: #3a3a3a;"
+    return f"""
+        QLabel {{
+            {background}
+            border: 2px solid #2a2a2a;
+            border-radius: 0px;
+            padding: 6px 8px;
+            color: #f5e6c0;
+            font-weight: bold;
+            font-size: 18px;  /* Increased font size for readability */
+        }}
+    """
+
+
+@functools.lru_cache(maxsize=None)
+def get_tool_list_style():
+    """Build the tool list stylesheet once.
+
+    It is set on the list widget only; the buttons are matched by object
+    name, so Qt parses the rules once instead of once per button.
+    """
+    if has_button_image():
+        background = f"background: url({BUTTON_IMAGE_PATH}) center center stretch;"
+    else:
+        background = "background-color: #8b4a4a;"
+    return f"""
+        QWidget#toolList {{
+            background: #000000;
+        }}
+        QPushButton#toolButton {{
+            border: 2px solid #2a2a2a;
+            border-radius: 0px;
+            padding: 6px 10px;
+            color: #f5e6c0;
+            font-weight: bold;
+            font-size: 20px;
+            min-height: 38px;
+            max-height: 42px;
+            text-align: left;
+            {background}
+        }}
+        QPushButton#toolButton:hover {{
+            border-color: #8b4a4a;
+            background-color: rgba(139, 74, 74, 120);
+        }}
+        QPushButton#toolButton:pressed {{
+            border: 2px inset #2a2a2a;
+            background-color: rgba(139, 74, 74, 150);
+        }}
+    """
+
+
+# Profiles keyed by storage name, created on first use and kept for the
+# application lifetime - pages come and go, their profile does not
+_profile_pool = {}
+
+
+def get_or_create_profile(profile_name, storage_name, settings_table):
+    """Get a pooled persistent profile, creating and configuring it on first use.
+
+    Profiles are parented to the application, so any number of pages can share
+    one without a window owning it. Only touched from the GUI thread.
+    """
+    profile = _profile_pool.get(profile_name)
+    if profile is not None:
+        return profile
+    
+    profile = QWebEngineProfile(profile_name, QApplication.instance())
+    profile.setCachePath(config.get_persistent_cache_path(storage_name))
+    profile.setPersistentStoragePath(config.get_persistent_profile_path(storage_name))
+    profile.setPersistentCookiesPolicy(
+        QWebEngineProfile.PersistentCookiesPolicy.ForcePersistentCookies
+    )
+    # In-memory cache capped at TOOLS_MEMORY_CACHE_SIZE by default; it is held
+    # for as long as the pooled profile, i.e. the rest of the session. With
+    # tool_disk_cache on, each tool gets a disk cache of Chromium's default size.
+    cache_type, cache_size = get_tools_http_cache(disk_size=0)
+    profile.setHttpCacheType(cache_type)
+    profile.setHttpCacheMaximumSize(cache_size)
+    
+    settings = profile.settings()
+    for attribute, enabled in get_optimized_settings(settings_table):
+        settings.setAttribute(attribute, enabled)
+    
+    _profile_pool[profile_name] = profile
+    return profile
+
+
+def get_tool_window_profile(title):
+    """Get the persistent profile for a tool window"""
+    name = title.replace(' ', '_')
+    return get_or_create_profile(f"ToolWindow_{name}", f"tool_{name}", TOOL_WINDOW_SETTINGS)
+
+
+def get_ingame_browser_profile(title):
+    """Get the persistent profile for a standalone in-game browser"""
+    name = title.replace(' ', '_')
+    return get_or_create_profile(f"InGameBrowser_{name}", f"ingame_{name}", INGAME_BROWSER_SETTINGS)
+
+
+def is_live_window(window):
+    """Check whether a tracked window still exists and is visible"""
+    try:
+        return window.isVisible()
+    except RuntimeError:
+        # The C++ window is already gone
+        return False
+
+
+def create_web_view(profile):
+    """Create a view whose page uses profile, without a default page first"""
+    try:
+        # Qt 6.4+: the view builds its page for the profile itself
+        return QWebEngineView(profile)
+    except TypeError:
+        view = QWebEngineView()
+        view.setPage(QWebEnginePage(profile, view))
+        return view
+
 
 class ToolWindow(QMainWindow):
     closed = pyqtSignal()
     
+    # Windows with an unsaved geometry change, flushed together by one timer
+    # shared by every tool window
+    _pending_geometry_saves = weakref.WeakSet()
+    _geometry_save_timer = None
+    
     def __init__(self, url, title, parent=None):
         super().__init__(parent)
         self.setWindowTitle(f"LostKit - {title}")
@@ -26,85 +322,57 @@ class ToolWindow(QMainWindow):
         # CRITICAL: Make window appear as separate task in Windows taskbar
         self.setWindowFlags(Qt.WindowType.Window)
         
-        if os.path.exists("icon.ico"):
-            self.setWindowIcon(QIcon("icon.ico"))
+        app_icon = get_app_icon()
+        if app_icon is not None:
+            self.setWindowIcon(app_icon)
         
         palette = QPalette()
         palette.setColor(QPalette.ColorRole.Window, QColor(0, 0, 0))
         self.setPalette(palette)
         
         self.tool_name = title
+        # Last geometry written to config - unchanged geometry is never rewritten
+        self.last_saved_geometry = None
         self.load_window_geometry()
         self.setMinimumSize(600, 400)
 
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
-        layout = QVBoxLayout(central_widget)
-        layout.setContentsMargins(0, 0, 0, 0)
+        self.central_layout = QVBoxLayout(central_widget)
+        self.central_layout.setContentsMargins(0, 0, 0, 0)
 
-        profile_name = f"ToolWindow_{title.replace(' ', '_')}"
+        # The web engine side (profile, view, renderer) is only set up when
+        # the window is first shown
+        self.web_view = None
+        self.pending_url = url
         
+        # Applied before the first show, so the window is only laid out once
+        self.force_apply_readable_fonts()
+
+    def setup_web_view(self):
+        """Create the view for this tool and start loading its URL"""
         try:
-            profile = QWebEngineProfile(profile_name, self)
-            cache_path = config.get_persistent_cache_path(f"tool_{title.replace(' ', '_')}")
-            storage_path = config.get_persistent_profile_path(f"tool_{title.replace(' ', '_')}")
-            
-            profile.setCachePath(cache_path)
-            profile.setPersistentStoragePath(storage_path)
-            profile.setPersistentCookiesPolicy(
-                QWebEngineProfile.PersistentCookiesPolicy.ForcePersistentCookies
-            )
-            
-            settings = profile.settings()
-            if get_config_value("resource_optimization", True):
-                settings.setAttribute(QWebEngineSettings.WebAttribute.AutoLoadImages, True)
-                settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptEnabled, True)
-                settings.setAttribute(QWebEngineSettings.WebAttribute.LocalStorageEnabled, True)
-                settings.setAttribute(QWebEngineSettings.WebAttribute.PluginsEnabled, False)
-                settings.setAttribute(QWebEngineSettings.WebAttribute.WebGLEnabled, False)
-                settings.setAttribute(QWebEngineSettings.WebAttribute.Accelerated2dCanvasEnabled, False)
-
-            page = QWebEnginePage(profile, self)
-            self.web_view = QWebEngineView()
-            self.web_view.setPage(page)
-            
-            self.profile_name = profile_name
-            self.cache_path = cache_path
-            self.storage_path = storage_path
-            self._profile = profile
+            # Pooled per tool, so reopening a tool reuses its warm profile
+            profile = get_tool_window_profile(self.tool_name)
+
+            # The pool keeps the profile alive for the application lifetime
+            self.web_view = create_web_view(profile)
             
         except Exception as e:
-            print(f"Error creating web engine profile: {e}")
+            log.error("Error creating web engine profile: %s", e)
             self.web_view = QWebEngineView()
-            self.profile_name = None
-            self.cache_path = None
-            self.storage_path = None
-            self._profile = None
-        
-        layout.addWidget(self.web_view)
-        self.web_view.setUrl(QUrl(url))
-        
-        self.cleanup_timer = QTimer(self)
-        self.cleanup_timer.timeout.connect(self.perform_cleanup)
-        cleanup_interval = get_config_value("cache_cleanup_interval", 300) * 1000
-        self.cleanup_timer.start(cleanup_interval)
         
-        QTimer.singleShot(100, self.force_apply_readable_fonts)
+        self.central_layout.addWidget(self.web_view)
+        self.web_view.setUrl(QUrl(self.pending_url))
+        self.pending_url = None
+
+    def showEvent(self, event):
+        if self.web_view is None:
+            self.setup_web_view()
+        super().showEvent(event)
 
     def force_apply_readable_fonts(self):
-        font = QFont()
-        if font_loader.is_custom_font_available():
-            font.setFamily(font_loader.get_font_family_name())
-        else:
-            test_font = QFont("Runescape-Quill-Caps", 18)
-            if test_font.exactMatch():
-                font.setFamily("Runescape-Quill-Caps")
-            else:
-                font.setFamily("Arial")
-        
-        font.setPointSize(18)
-        font.setWeight(QFont.Weight.Normal)
-        self.setFont(font)
+        self.setFont(font_loader.get_ui_font(18))
 
     def load_window_geometry(self):
         try:
@@ -112,11 +380,15 @@ class ToolWindow(QMainWindow):
             geom = get_config_value(config_key, None)
             
             if geom and isinstance(geom, list) and len(geom) == 4:
-                x, y, w, h = [int(val) for val in geom]
-                x = max(0, min(x, 1920 - w))
-                y = max(0, min(y, 1080 - h))
-                w = max(600, min(w, 1920))
-                h = max(400, min(h, 1080))
+                x, y, w, h = map(int, geom)
+                
+                # Keep the window on the screen it was saved on
+                screen = QGuiApplication.screenAt(QPoint(x, y)) or QGuiApplication.primaryScreen()
+                area = screen.availableGeometry()
+                w = max(600, min(w, area.width()))
+                h = max(400, min(h, area.height()))
+                x = max(area.left(), min(x, area.left() + area.width() - w))
+                y = max(area.top(), min(y, area.top() + area.height() - h))
                 self.setGeometry(x, y, w, h)
             else:
                 offset = hash(self.tool_name) % 10 * 25
@@ -126,50 +398,57 @@ class ToolWindow(QMainWindow):
 
     def save_window_geometry(self):
         try:
-            geom = self.geometry()
+            geometry = self.geometry().getRect()
+            if geometry == self.last_saved_geometry:
+                return
+            self.last_saved_geometry = geometry
             config_key = f"tool_window_geometry_{self.tool_name.replace(' ', '_')}"
-            set_config_value(config_key, [geom.x(), geom.y(), geom.width(), geom.height()])
+            # Only updates the config cache; closing several windows at once
+            # still ends in a single coalesced disk write
+            set_config_value(config_key, list(geometry))
         except Exception as e:
-            print(f"Error saving tool window geometry: {e}")
-
-    def perform_cleanup(self):
-        try:
-            if get_config_value("resource_optimization", True):
-                gc.collect()
-        except Exception as e:
-            print(f"Error during tool window cleanup: {e}")
+            log.error("Error saving tool window geometry: %s", e)
 
     def cleanup_cache_files(self):
         pass
 
+    def schedule_geometry_save(self):
+        """Save the geometry once resize/move bursts have been quiet for 2 s"""
+        ToolWindow._pending_geometry_saves.add(self)
+        timer = ToolWindow._geometry_save_timer
+        if timer is None:
+            timer = ToolWindow._geometry_save_timer = QTimer(QApplication.instance())
+            timer.setSingleShot(True)
+            timer.setTimerType(Qt.TimerType.CoarseTimer)
+            timer.timeout.connect(ToolWindow.flush_geometry_saves)
+        timer.start(2000)
+
+    @staticmethod
+    def flush_geometry_saves():
+        """Save the geometry of every window changed since the last flush"""
+        windows = list(ToolWindow._pending_geometry_saves)
+        ToolWindow._pending_geometry_saves.clear()
+        for window in windows:
+            window.save_window_geometry()
+
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        if not hasattr(self, 'save_timer'):
-            self.save_timer = QTimer(self)
-            self.save_timer.setSingleShot(True)
-            self.save_timer.timeout.connect(self.save_window_geometry)
-        self.save_timer.start(1000)
+        self.schedule_geometry_save()
 
     def moveEvent(self, event):
         super().moveEvent(event)
-        if not hasattr(self, 'save_timer'):
-            self.save_timer = QTimer(self)
-            self.save_timer.setSingleShot(True)
-            self.save_timer.timeout.connect(self.save_window_geometry)
-        self.save_timer.start(1000)
+        self.schedule_geometry_save()
 
     def closeEvent(self, event):
+        ToolWindow._pending_geometry_saves.discard(self)
         self.save_window_geometry()
-        if hasattr(self, 'cleanup_timer'):
-            self.cleanup_timer.stop()
         if hasattr(self, 'web_view') and self.web_view:
             try:
                 self.web_view.setPage(None)
                 self.web_view.deleteLater()
             except Exception as e:
-                print(f"Error cleaning up web view: {e}")
+                log.error("Error cleaning up web view: %s", e)
         self.closed.emit()
-        gc.collect()
         event.accept()
 
 
@@ -185,42 +464,14 @@ class InGameBrowser(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
 
-        profile_name = f"InGameBrowser_{title.replace(' ', '_')}"
-        
         try:
-            profile = QWebEngineProfile(profile_name, self)
-            cache_path = config.get_persistent_cache_path(f"ingame_{title.replace(' ', '_')}")
-            storage_path = config.get_persistent_profile_path(f"ingame_{title.replace(' ', '_')}")
-                
-            profile.setCachePath(cache_path)
-            profile.setPersistentStoragePath(storage_path)
-            profile.setPersistentCookiesPolicy(
-                QWebEngineProfile.PersistentCookiesPolicy.ForcePersistentCookies
-            )
-            
-            settings = profile.settings()
-            if get_config_value("resource_optimization", True):
-                settings.setAttribute(QWebEngineSettings.WebAttribute.AutoLoadImages, True)
-                settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptEnabled, True)
-                settings.setAttribute(QWebEngineSettings.WebAttribute.LocalStorageEnabled, True)
-                settings.setAttribute(QWebEngineSettings.WebAttribute.PluginsEnabled, False)
-
-            page = QWebEnginePage(profile, self)
-            self.web_view = QWebEngineView()
-            self.web_view.setPage(page)
-            
-            self.profile_name = profile_name
-            self.cache_path = cache_path
-            self.storage_path = storage_path
-            self._profile = profile
+            # Each tool keeps its own cookies and logins; the profile is pooled,
+            # so reopening a tab reuses it instead of setting up a new one
+            self.web_view = create_web_view(get_ingame_browser_profile(title))
             
         except Exception as e:
-            print(f"Error creating in-game browser profile: {e}")
+            log.error("Error creating in-game browser profile: %s", e)
             self.web_view = QWebEngineView()
-            self.profile_name = None
-            self.cache_path = None
-            self.storage_path = None
-            self._profile = None
         
         layout.addWidget(self.web_view)
         self.web_view.setUrl(QUrl(url))
@@ -234,7 +485,7 @@ class InGameBrowser(QWidget):
                 self.web_view.setPage(None)
                 self.web_view.deleteLater()
             except Exception as e:
-                print(f"Error cleaning up web view: {e}")
+                log.error("Error cleaning up web view: %s", e)
         self.closed.emit()
         event.accept()
 
@@ -245,6 +496,10 @@ class RightToolsPanel(QWidget):
     panel_collapse_requested = pyqtSignal(bool)
     world_switch_requested = pyqtSignal()
     
+    # Base button width plus margins, scrollbar and group box padding
+    OPTIMAL_WIDTH = 160 + 16 + 23 + 8 + 10 + 16 + 8
+    COLLAPSED_WIDTH = 25
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
@@ -252,90 +507,96 @@ class RightToolsPanel(QWidget):
         
         # CHANGE: Use normal dict instead of weakref for better control
         self.tool_windows = {}  # key: tool_name, value: ToolWindow instance
-        self.window_count = 0
         
         self.world_switcher_window = None
         self.current_world_info = "No world"  # Default to "No world" on startup
         
         self.collapsed = get_config_value("right_panel_collapsed", False)
         self.saved_width = self.config.get("right_panel_width", 250)
+        self.chat_visible = self.config.get("chat_panel_visible", True)
+        
+        # Read once; refresh_tool_urls picks up a changed list
+        self.tool_urls = get_tool_urls()
+        
+        # Read on every tool launch, so cached and kept current through
+        # config change notifications
+        self.external_mode = get_config_value("open_external", True)
+        self.max_tool_windows = get_config_value("max_tool_windows", 10)
+        config.signals.value_changed.connect(self.on_config_changed)
         
         palette = QPalette()
         palette.setColor(QPalette.ColorRole.Window, QColor(0, 0, 0))
         self.setPalette(palette)
         
-        self.optimal_width = self.calculate_optimal_width()
-        
         if self.collapsed:
-            self.setFixedWidth(25)
+            self.setFixedWidth(self.COLLAPSED_WIDTH)
         else:
-            self.setFixedWidth(self.optimal_width)
+            self.setFixedWidth(self.OPTIMAL_WIDTH)
         
+        self.setFont(font_loader.get_ui_font(20))
         self.setup_ui()
-        QTimer.singleShot(100, self.force_apply_readable_fonts)
-        
-    def force_apply_readable_fonts(self):
-        button_font = QFont()
-        if font_loader.is_custom_font_available():
-            button_font.setFamily(font_loader.get_font_family_name())
-        else:
-            test_font = QFont("Runescape-Quill-Caps", 18)
-            if test_font.exactMatch():
-                button_font.setFamily("Runescape-Quill-Caps")
-            else:
-                button_font.setFamily("Arial")
-        
-        button_font.setPointSize(20)
-        button_font.setWeight(QFont.Weight.Normal)
         
-        group_font = QFont()
-        group_font.setFamily(button_font.family())
-        group_font.setPointSize(22)
-        group_font.setWeight(QFont.Weight.Bold)
+    def force_apply_readable_fonts(self, root=None):
+        """Apply the readable fonts to root (default: the whole panel) and its children"""
+        if root is None:
+            root = self
+        button_font = font_loader.get_ui_font(20)
+        group_font = font_loader.get_ui_font(22, QFont.Weight.Bold)
+        checkbox_font = font_loader.get_ui_font(18)
         
-        checkbox_font = QFont()
-        checkbox_font.setFamily(button_font.family())
-        checkbox_font.setPointSize(18)
-        
-        self.apply_fonts_to_children(self, button_font, group_font, checkbox_font)
-    
-    def apply_fonts_to_children(self, widget, button_font, group_font, checkbox_font):
         try:
-            if isinstance(widget, QPushButton):
-                widget.setFont(button_font)
-            elif isinstance(widget, QGroupBox):
-                widget.setFont(group_font)
-            elif isinstance(widget, QCheckBox):
-                widget.setFont(checkbox_font)
-            elif isinstance(widget, QLabel):
-                widget.setFont(button_font)
-            else:
-                widget.setFont(button_font)
-            
-            for child in widget.findChildren(QWidget):
-                self.apply_fonts_to_children(child, button_font, group_font, checkbox_font)
-                
+            # Everything inherits the button font from root; only widgets that
+            # need a different font get one explicitly
+            root.setFont(button_font)
+            for group in root.findChildren(QGroupBox):
+                group.setFont(group_font)
+                # Restore the button font below the group's title
+                for child in group.findChildren(QWidget, options=Qt.FindChildOption.FindDirectChildrenOnly):
+                    child.setFont(button_font)
+            for checkbox in root.findChildren(QCheckBox):
+                checkbox.setFont(checkbox_font)
         except Exception as e:
-            print(f"Error applying fonts: {e}")
-        
-    def calculate_optimal_width(self):
-        base_button_width = 160
-        total_width = base_button_width + 16 + 23 + 8 + 10 + 16 + 8
-        return total_width
+            log.error("Error applying fonts: %s", e)
         
     def setup_ui(self):
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(4, 4, 4, 4)
         main_layout.setSpacing(6)
         
-        if self.collapsed:
-            self.setup_collapsed_ui(main_layout)
+        # Each state lives in its own container, built the first time it is
+        # shown and afterwards only hidden/shown on collapse and expand
+        self.collapsed_container = None
+        self.expanded_container = None
+        self.show_state_ui(self.collapsed)
+
+    def create_state_container(self, setup):
+        """Build a container for one panel state and add it to the main layout"""
+        container = QWidget()
+        layout = QVBoxLayout(container)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(6)
+        setup(layout)
+        # Fonts go on before the container is first laid out and shown
+        self.force_apply_readable_fonts(container)
+        self.layout().addWidget(container, 1)
+        return container
+
+    def show_state_ui(self, collapsed):
+        """Show the collapsed or expanded container, building it on first use"""
+        if collapsed:
+            if self.collapsed_container is None:
+                self.collapsed_container = self.create_state_container(self.setup_collapsed_ui)
+            visible, hidden = self.collapsed_container, self.expanded_container
         else:
-            self.setup_expanded_ui(main_layout)
+            if self.expanded_container is None:
+                self.expanded_container = self.create_state_container(self.setup_expanded_ui)
+            visible, hidden = self.expanded_container, self.collapsed_container
+        
+        if hidden is not None:
+            hidden.setVisible(False)
+        visible.setVisible(True)
 
     def setup_collapsed_ui(self, main_layout):
-        self.clear_layout(main_layout)
-        
         main_layout.addStretch()
         
         expand_container = QWidget()
@@ -345,19 +606,7 @@ class RightToolsPanel(QWidget):
         
         self.expand_btn = QPushButton("▶")
         self.expand_btn.setFixedSize(18, 35)
-        self.expand_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #8b4a4a;
-                border: 1px solid #2a2a2a;
-                border-radius: 2px;
-                color: #f5e6c0;
-                font-weight: bold;
-                font-size: 10px;
-            }
-            QPushButton:hover {
-                background-color: #a55a5a;
-            }
-        """)
+        self.expand_btn.setStyleSheet(EXPAND_BUTTON_STYLE)
         self.expand_btn.clicked.connect(self.expand_panel)
         
         expand_layout.addStretch()
@@ -367,61 +616,22 @@ class RightToolsPanel(QWidget):
         main_layout.addStretch()
 
     def setup_expanded_ui(self, main_layout):
-        self.clear_layout(main_layout)
-        
         # Current world display with button.jpg background
         self.world_info_label = self.create_world_info_display()
         main_layout.addWidget(self.world_info_label)
         
         # Settings panel
         settings_group = QGroupBox("Settings")
-        settings_group.setStyleSheet("""
-            QGroupBox {
-                background: #000000;
-                color: #f5e6c0;
-                font-weight: bold;
-                border: 2px solid #2a2a2a;
-                border-radius: 0px;
-                margin: 3px 0px;
-                padding-top: 8px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 8px 0 8px;
-                background-color: #2a2a2a;
-            }
-        """)
+        settings_group.setStyleSheet(GROUP_BOX_STYLE)
         settings_layout = QVBoxLayout()
         settings_layout.setContentsMargins(8, 8, 8, 8)
         settings_layout.setSpacing(5)
         
         self.external_cb = QCheckBox("Open tools externally")
         # CHANGE: Load saved state from config
-        saved_external = get_config_value("open_external", True)
-        self.external_cb.setChecked(saved_external)
+        self.external_cb.setChecked(self.external_mode)
         self.external_cb.stateChanged.connect(self.toggle_external_mode)
-        self.external_cb.setStyleSheet("""
-            QCheckBox {
-                color: #f5e6c0;
-                spacing: 8px;
-                background: transparent;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-            }
-            QCheckBox::indicator:unchecked {
-                background-color: #4a4a4a;
-                border: 2px solid #2a2a2a;
-                border-radius: 0px;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #8b4a4a;
-                border: 2px solid #2a2a2a;
-                border-radius: 0px;
-            }
-        """)
+        self.external_cb.setStyleSheet(EXTERNAL_CHECKBOX_STYLE)
         settings_layout.addWidget(self.external_cb)
         
         settings_group.setLayout(settings_layout)
@@ -432,24 +642,7 @@ class RightToolsPanel(QWidget):
         self.world_switcher_btn = QPushButton("World Switcher")
         self.world_switcher_btn.setFixedHeight(35)
         self.world_switcher_btn.clicked.connect(self.open_world_switcher)
-        self.world_switcher_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #8b4a4a;
-                border: 2px solid #2a2a2a;
-                border-radius: 0px;
-                padding: 8px 12px;
-                color: #f5e6c0;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #a55a5a;
-                border-color: #8b4a4a;
-            }
-            QPushButton:pressed {
-                background-color: #8b4a4a;
-                border: 2px inset #2a2a2a;
-            }
-        """)
+        self.world_switcher_btn.setStyleSheet(WORLD_SWITCHER_BUTTON_STYLE)
         main_layout.addWidget(self.world_switcher_btn)
         
         # IRC Chat toggle button
@@ -457,30 +650,13 @@ class RightToolsPanel(QWidget):
         self.chat_toggle_btn.setFixedHeight(35)
         self.chat_toggle_btn.clicked.connect(self.toggle_chat)
         
-        is_visible = self.config.get("chat_panel_visible", True)
-        self.update_chat_button_style(is_visible)
+        self.update_chat_button_style(self.chat_visible)
         
         main_layout.addWidget(self.chat_toggle_btn)
         
         # Tools panel
         tools_group = QGroupBox("Tools")
-        tools_group.setStyleSheet("""
-            QGroupBox {
-                background: #000000;
-                color: #f5e6c0;
-                font-weight: bold;
-                border: 2px solid #2a2a2a;
-                border-radius: 0px;
-                margin: 3px 0px;
-                padding-top: 8px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 8px 0 8px;
-                background-color: #2a2a2a;
-            }
-        """)
+        tools_group.setStyleSheet(GROUP_BOX_STYLE)
         tools_layout = QVBoxLayout()
         tools_layout.setContentsMargins(5, 5, 5, 5)
         tools_layout.setSpacing(4)
@@ -489,52 +665,50 @@ class RightToolsPanel(QWidget):
         self.scroll_area.setWidgetResizable(True)
         self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.scroll_area.setStyleSheet("""
-            QScrollArea {
-                background: #000000;
-                border: 1px solid #2a2a2a;
-            }
-            QScrollBar:vertical {
-                background: #2a2a2a;
-                width: 14px;
-                border: 1px solid #2a2a2a;
-            }
-            QScrollBar::handle:vertical {
-                background: #8b4a4a;
-                min-height: 20px;
-                border-radius: 0px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #a55a5a;
-            }
-        """)
+        self.scroll_area.setStyleSheet(SCROLL_AREA_STYLE)
         
         self.scroll_widget = QWidget()
-        self.scroll_widget.setStyleSheet("background: #000000;")
+        self.scroll_widget.setObjectName("toolList")
+        self.scroll_widget.setStyleSheet(get_tool_list_style())
         self.scroll_layout = QVBoxLayout(self.scroll_widget)
         self.scroll_layout.setSpacing(4)
         self.scroll_layout.setContentsMargins(5, 5, 20, 5)
         
         self.tool_buttons = []
-        tool_urls = get_tool_urls()
-        for tool_name, url in tool_urls.items():
-            btn = self.create_tool_button(tool_name, url)
-            self.scroll_layout.addWidget(btn)
-            self.tool_buttons.append(btn)
+        self.add_tool_buttons()
         
-        self.scroll_layout.addStretch()
         self.scroll_area.setWidget(self.scroll_widget)
         tools_layout.addWidget(self.scroll_area)
         
         tools_group.setLayout(tools_layout)
         main_layout.addWidget(tools_group, 1)
 
-    def clear_layout(self, layout):
-        while layout.count():
-            child = layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-    
+    def add_tool_buttons(self):
+        """Fill the tools list from the cached tool URLs"""
+        for tool_name, url in self.tool_urls.items():
+            btn = self.create_tool_button(tool_name, url)
+            self.scroll_layout.addWidget(btn)
+            self.tool_buttons.append(btn)
+        self.scroll_layout.addStretch()
+
+    def refresh_tool_urls(self):
+        """Re-read the tool URLs and rebuild the tool buttons if they changed"""
+        tool_urls = get_tool_urls()
+        if tool_urls == self.tool_urls:
+            return
+        self.tool_urls = tool_urls
+        
+        # The tools list is only built with the expanded UI
+        if not hasattr(self, 'scroll_layout'):
+            return
+        while self.scroll_layout.count():
+            item = self.scroll_layout.takeAt(0)
+            if item.widget():
+                item.widget().deleteLater()
+        self.tool_buttons = []
+        self.add_tool_buttons()
+        self.force_apply_readable_fonts(self.scroll_widget)
+
     def create_world_info_display(self):
         """Create the world info display widget with button.jpg background and larger, readable text"""
         world_label = QLabel(self.current_world_info)
@@ -542,31 +716,7 @@ class RightToolsPanel(QWidget):
         world_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         world_label.setWordWrap(True)
         
-        button_image_path = "button.jpg"
-        if os.path.exists(button_image_path):
-            world_label.setStyleSheet(f"""
-                QLabel {{
-                    background: url({button_image_path}) center center stretch;
-                    border: 2px solid #2a2a2a;
-                    border-radius: 0px;
-                    padding: 6px 8px;
-                    color: #f5e6c0;
-                    font-weight: bold;
-                    font-size: 18px;  /* Increased font size for readability */
-                }}
-            """)
-        else:
-            world_label.setStyleSheet("""
-                QLabel {
-                    background-color: #3a3a3a;
-                    border: 2px solid #2a2a2a;
-                    border-radius: 0px;
-                    padding: 6px 8px;
-                    color: #f5e6c0;
-                    font-weight: bold;
-                    font-size: 18px;  /* Increased font size for readability */
-                }
-            """)
+        world_label.setStyleSheet(get_world_label_style())
         
         return world_label
     
@@ -588,11 +738,9 @@ class RightToolsPanel(QWidget):
     def expand_panel(self):
         self.collapsed = False
         set_config_value("right_panel_collapsed", False)
-        self.setFixedWidth(self.optimal_width)
-        main_layout = self.layout()
-        self.setup_expanded_ui(main_layout)
+        self.setFixedWidth(self.OPTIMAL_WIDTH)
+        self.show_state_ui(False)
         self.panel_collapse_requested.emit(False)
-        QTimer.singleShot(100, self.force_apply_readable_fonts)
 
     def set_collapsed_state(self, collapsed):
         if self.collapsed != collapsed:
@@ -600,49 +748,22 @@ class RightToolsPanel(QWidget):
             set_config_value("right_panel_collapsed", collapsed)
             
             if collapsed:
-                self.setFixedWidth(25)
+                self.setFixedWidth(self.COLLAPSED_WIDTH)
             else:
-                self.setFixedWidth(self.optimal_width)
+                self.setFixedWidth(self.OPTIMAL_WIDTH)
             
-            main_layout = self.layout()
-            if collapsed:
-                self.setup_collapsed_ui(main_layout)
-            else:
-                self.setup_expanded_ui(main_layout)
-                QTimer.singleShot(100, self.force_apply_readable_fonts)
+            self.show_state_ui(collapsed)
 
     def update_chat_button_style(self, is_visible):
-        if self.collapsed:
+        # Remembered for an expanded UI that has not been built yet
+        self.chat_visible = is_visible
+        if not hasattr(self, 'chat_toggle_btn'):
             return
             
-        if is_visible:
-            self.chat_toggle_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #4a6a4a;
-                    border: 2px solid #2a2a2a;
-                    border-radius: 0px;
-                    padding: 8px 12px;
-                    color: #f5e6c0;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #5a7a5a;
-                }
-            """)
-        else:
-            self.chat_toggle_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #8b4a4a;
-                    border: 2px solid #2a2a2a;
-                    border-radius: 0px;
-                    padding: 8px 12px;
-                    color: #f5e6c0;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #a55a5a;
-                }
-            """)
+        style = CHAT_BUTTON_ACTIVE_STYLE if is_visible else CHAT_BUTTON_INACTIVE_STYLE
+        # Setting a stylesheet re-polishes the button, so skip it when unchanged
+        if self.chat_toggle_btn.styleSheet() != style:
+            self.chat_toggle_btn.setStyleSheet(style)
 
     def toggle_chat(self):
         self.chat_toggle_requested.emit()
@@ -650,25 +771,20 @@ class RightToolsPanel(QWidget):
     def create_tool_button(self, name, url):
         icon_path = get_icon_path(name)
         
-        display_name = name
-        if len(name) > 12:
-            if name == "Clue Coordinates":
-                display_name = "Coordinates"
-            elif name == "Clue Scroll Help":
-                display_name = "Clue Help"
-            elif name == "Market Prices":
-                display_name = "Prices"
+        display_name = TOOL_DISPLAY_NAMES.get(name, name)
         
-        if os.path.exists(icon_path) and icon_path.endswith('.png'):
+        # get_icon_path only returns a .png path when the file exists
+        if icon_path.endswith('.png'):
             btn = QPushButton()
-            icon = QIcon(icon_path)
-            btn.setIcon(icon)
             btn.setIconSize(QSize(26, 26))
             btn.setText(display_name)
+            # The PNG is decoded on the thread pool; the icon appears once ready
+            load_icon_async(icon_path, btn.setIcon)
         else:
             btn = QPushButton(f"{icon_path} {display_name}")
         
-        btn.setStyleSheet(self.get_button_style())
+        # Styled by the tool list's stylesheet
+        btn.setObjectName("toolButton")
         btn.setFixedHeight(42)
         btn.setMinimumWidth(160)
         btn.setMaximumWidth(200)
@@ -676,47 +792,10 @@ class RightToolsPanel(QWidget):
         btn.clicked.connect(lambda checked, n=name, u=url: self.open_tool(n, u))
         return btn
 
-    def get_button_style(self):
-        button_image_path = "button.jpg"
-        base_style = """
-            QPushButton {
-                border: 2px solid #2a2a2a;
-                border-radius: 0px;
-                padding: 6px 10px;
-                color: #f5e6c0;
-                font-weight: bold;
-                font-size: 20px;
-                min-height: 38px;
-                max-height: 42px;
-                text-align: left;
-        """
-        
-        if os.path.exists(button_image_path):
-            base_style += f"background: url({button_image_path}) center center stretch;"
-        else:
-            base_style += "background-color: #8b4a4a;"
-        
-        base_style += """
-            }
-            QPushButton:hover {
-                border-color: #8b4a4a;
-                background-color: rgba(139, 74, 74, 120);
-            }
-            QPushButton:pressed {
-                border: 2px inset #2a2a2a;
-                background-color: rgba(139, 74, 74, 150);
-            }
-        """
-        
-        return base_style
-        
     def open_tool(self, name, url):
-        max_windows = get_config_value("max_tool_windows", 10)
-        external_mode = get_config_value("open_external", True)
+        max_windows = self.max_tool_windows
         
-        if external_mode:
-            self.cleanup_dead_windows()
-            
+        if self.external_mode:
             # CHANGE: Check if tool window already exists for this tool
             if name in self.tool_windows:
                 existing_window = self.tool_windows[name]
@@ -725,13 +804,17 @@ class RightToolsPanel(QWidget):
                     existing_window.show()
                     existing_window.activateWindow()
                     existing_window.raise_()
-                    print(f"Bringing existing {name} window to front")
+                    log.debug("Bringing existing %s window to front", name)
                     return
                 except Exception as e:
-                    print(f"Error activating existing window: {e}")
+                    log.warning("Error activating existing window: %s", e)
                     # Remove dead reference and continue to create new window
                     del self.tool_windows[name]
             
+            # closed signals keep tool_windows current; the sweep is only a
+            # safety net before refusing to open another window
+            if len(self.tool_windows) >= max_windows:
+                self.cleanup_dead_windows()
             if len(self.tool_windows) >= max_windows:
                 QMessageBox.warning(
                     self, 
@@ -747,9 +830,8 @@ class RightToolsPanel(QWidget):
                 tool_window.closed.connect(lambda: self.on_tool_window_closed(name))
                 tool_window.show()
                 self.tool_windows[name] = tool_window
-                self.window_count += 1
             except Exception as e:
-                print(f"Error creating tool window: {e}")
+                log.error("Error creating tool window: %s", e)
         else:
             self.browser_requested.emit(url, name)
 
@@ -757,47 +839,37 @@ class RightToolsPanel(QWidget):
         """Handle tool window closed signal - remove from tracking"""
         if tool_name in self.tool_windows:
             del self.tool_windows[tool_name]
-            print(f"Removed {tool_name} from tool windows tracking")
+            log.debug("Removed %s from tool windows tracking", tool_name)
 
     def cleanup_dead_windows(self):
-        dead_keys = []
-        for key, window_ref in list(self.tool_windows.items()):
-            try:
-                if not hasattr(window_ref, 'isVisible') or not window_ref.isVisible():
-                    dead_keys.append(key)
-            except RuntimeError:
-                dead_keys.append(key)
-        
-        for key in dead_keys:
-            if key in self.tool_windows:
-                del self.tool_windows[key]
+        """Drop windows that are hidden or already deleted, in one pass"""
+        self.tool_windows = {key: window for key, window in self.tool_windows.items()
+                             if is_live_window(window)}
             
+    def on_config_changed(self, key, value):
+        """Track changes to the cached tool launch settings"""
+        if key == "open_external":
+            self.external_mode = bool(value)
+        elif key == "max_tool_windows":
+            self.max_tool_windows = value
+
     def toggle_external_mode(self, state):
         external = state == Qt.CheckState.Checked.value
+        self.external_mode = external
         set_config_value("open_external", external)
         if not external:
             self.close_all_tool_windows()
 
     def close_all_tool_windows(self):
-        windows_to_close = []
-        
-        for window_ref in list(self.tool_windows.values()):
-            try:
-                if hasattr(window_ref, 'isVisible') and window_ref.isVisible():
-                    windows_to_close.append(window_ref)
-            except RuntimeError:
-                pass
-        
-        for window in windows_to_close:
+        # Detach the dict first - each close() emits closed, which would
+        # otherwise remove entries while they are being iterated
+        windows, self.tool_windows = self.tool_windows, {}
+        for window in windows.values():
             try:
                 window.close()
             except RuntimeError:
                 pass
-        
-        self.tool_windows.clear()
-        self.window_count = 0
 
     def closeEvent(self, event):
         self.close_all_tool_windows()
-        gc.collect()
         event.accept()
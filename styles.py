@@ -1,5 +1,9 @@
 # styles.py - Updated with readable 1.7x scaling instead of 5x
+import functools
 import os
+import types
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QIcon, QImage, QPixmap
 from font_loader import font_loader
 
 # Dark Pastel Theme Colors - GREY THEME
@@ -14,19 +18,33 @@ BORDER_COLOR = "#2a2a2a"          # Dark border
 ACTIVE_TAB_COLOR = "#3a3a3a"      # Dark grey for active tab (was green)
 INACTIVE_TAB_COLOR = "#4a4a4a"    # Light grey for inactive tabs
 
+# font_loader is a process-wide singleton, so its method can be bound once
+_get_font_stylesheet_family = font_loader.get_font_stylesheet_family
+
 def get_font_family_for_stylesheet():
     """Get the font family string for CSS stylesheets"""
-    return font_loader.get_font_stylesheet_family()
+    return _get_font_stylesheet_family()
 
 def get_scaled_size(base_size):
     """Helper to get 1.7x scaled font size for readable text"""
     return int(base_size * 1.7)  # Changed from 5x to 1.7x for readable text
 
+# Scaled sizes used by the main stylesheet, computed once
+SIZE_11 = get_scaled_size(11)
+SIZE_12 = get_scaled_size(12)
+SIZE_13 = get_scaled_size(13)
+SIZE_14 = get_scaled_size(14)
+
 # Generate the main stylesheet with custom font and readable text
 def get_main_stylesheet():
     """Generate the main stylesheet with proper font family and 1.7x larger fonts"""
-    font_family = get_font_family_for_stylesheet()
-    
+    # Keyed by family: MAIN_STYLESHEET below is built before the custom font
+    # is loaded, so the stylesheet has to follow the family, not be built once
+    return build_main_stylesheet(get_font_family_for_stylesheet())
+
+@functools.lru_cache(maxsize=4)
+def build_main_stylesheet(font_family):
+    """Build the main stylesheet for a font family (cached per family)"""
     return f"""
 QMainWindow {{
     color: {TEXT_COLOR};
@@ -38,13 +56,13 @@ QWidget {{
     background-color: #000000;
     color: {TEXT_COLOR};
     font-family: {font_family};
-    font-size: {get_scaled_size(14)}px;  /* 14px * 1.7 = 24px */
+    font-size: {SIZE_14}px;  /* 14px * 1.7 = 24px */
 }}
 
 /* Force custom font on all text elements - readable scaling */
 QLabel, QPushButton, QCheckBox, QGroupBox, QTabWidget, QTabBar {{
     font-family: {font_family};
-    font-size: {get_scaled_size(14)}px;  /* 14px * 1.7 = 24px */
+    font-size: {SIZE_14}px;  /* 14px * 1.7 = 24px */
 }}
 
 /* Tab Widget Styling - Simple and Clean with readable text */
@@ -61,7 +79,7 @@ QTabWidget::tab-bar {{
 QTabBar::tab {{
     font-family: {font_family};
     font-weight: bold;
-    font-size: {get_scaled_size(12)}px;  /* 12px * 1.7 = 20px - readable tab text */
+    font-size: {SIZE_12}px;  /* 12px * 1.7 = 20px - readable tab text */
     background-color: {INACTIVE_TAB_COLOR};
     border: 2px solid {BORDER_COLOR};
     border-radius: 0px;
@@ -78,7 +96,7 @@ QTabBar::tab:selected {{
     border-color: {BORDER_COLOR};
     color: {TEXT_COLOR};
     font-weight: bold;
-    font-size: {get_scaled_size(12)}px;  /* 12px * 1.7 = 20px */
+    font-size: {SIZE_12}px;  /* 12px * 1.7 = 20px */
 }}
 
 QTabBar::tab:hover:!selected {{
@@ -89,7 +107,7 @@ QTabBar::tab:hover:!selected {{
 /* Force readable font on ALL elements */
 * {{
     font-family: {font_family};
-    font-size: {get_scaled_size(14)}px;  /* 14px * 1.7 = 24px */
+    font-size: {SIZE_14}px;  /* 14px * 1.7 = 24px */
 }}
 
 QSplitter {{
@@ -156,7 +174,7 @@ QPushButton {{
     padding: 8px 10px;
     color: {TEXT_COLOR};
     font-weight: bold;
-    font-size: {get_scaled_size(11)}px;  /* 11px * 1.7 = 19px - readable button text */
+    font-size: {SIZE_11}px;  /* 11px * 1.7 = 19px - readable button text */
     min-height: 40px;
     max-height: 45px;
     text-align: center;
@@ -177,7 +195,7 @@ QPushButton:pressed {{
 QGroupBox {{
     color: {TEXT_COLOR};
     font-weight: bold;
-    font-size: {get_scaled_size(13)}px;  /* 13px * 1.7 = 22px - readable group titles */
+    font-size: {SIZE_13}px;  /* 13px * 1.7 = 22px - readable group titles */
     border: 2px solid {BORDER_COLOR};
     border-radius: 0px;
     margin: 8px 0px;
@@ -190,7 +208,7 @@ QGroupBox::title {{
     subcontrol-origin: margin;
     left: 12px;
     padding: 0 10px 0 10px;
-    font-size: {get_scaled_size(13)}px;  /* 13px * 1.7 = 22px */
+    font-size: {SIZE_13}px;  /* 13px * 1.7 = 22px */
     background-color: {DARKER_GREY};
     font-family: {font_family};
 }}
@@ -199,7 +217,7 @@ QGroupBox::title {{
 QCheckBox {{
     color: {TEXT_COLOR};
     spacing: 8px;
-    font-size: {get_scaled_size(12)}px;  /* 12px * 1.7 = 20px - readable checkbox text */
+    font-size: {SIZE_12}px;  /* 12px * 1.7 = 20px - readable checkbox text */
     background-color: #000000;
     font-family: {font_family};
 }}
@@ -230,7 +248,7 @@ QWebEngineView {{
 /* Make sure all labels have readable text */
 QLabel {{
     font-family: {font_family};
-    font-size: {get_scaled_size(14)}px;  /* 14px * 1.7 = 24px */
+    font-size: {SIZE_14}px;  /* 14px * 1.7 = 24px */
     color: {TEXT_COLOR};
 }}
 """
@@ -238,8 +256,20 @@ QLabel {{
 # For backward compatibility, also provide the constant
 MAIN_STYLESHEET = get_main_stylesheet()
 
+ICONS_DIR = "icons"
+
+@functools.lru_cache(maxsize=None)
+def get_bundled_icon_files():
+    """List the icons folder once instead of probing each icon file"""
+    # Resolved lazily: main() changes into the app directory after imports
+    try:
+        return frozenset(os.listdir(ICONS_DIR))
+    except OSError:
+        return frozenset()
+
+@functools.lru_cache(maxsize=None)
 def get_icon_path(tool_name):
-    """Return the path to PNG icon for a tool, with fallback to emoji"""
+    """Return the path to PNG icon for a tool, with fallback to emoji (cached)"""
     # Map tool names to their corresponding PNG file names
     icon_file_map = {
         "Clue Coordinates": "coordinates.png",
@@ -257,11 +287,8 @@ def get_icon_path(tool_name):
     
     # Get the PNG file name for this tool
     filename = icon_file_map.get(tool_name)
-    if filename:
-        # Check if the icons folder and file exist
-        icon_path = os.path.join("icons", filename)
-        if os.path.exists(icon_path):
-            return icon_path
+    if filename and filename in get_bundled_icon_files():
+        return os.path.join(ICONS_DIR, filename)
     
     # Fallback to emoji if PNG not found
     emoji_map = {
@@ -279,17 +306,98 @@ def get_icon_path(tool_name):
     }
     return emoji_map.get(tool_name, "🔧")
 
+# Icons decoded by IconLoader, keyed by path
+_loaded_icons = {}
+# Callbacks waiting on an icon that is still being decoded
+_pending_icon_callbacks = {}
+
+@functools.lru_cache(maxsize=64)
+def get_icon(icon_path):
+    """Decode an icon file once and share the QIcon"""
+    icon = _loaded_icons.get(icon_path)
+    if icon is None:
+        icon = QIcon(icon_path)
+    return icon
+
+class _IconSignals(QObject):
+    """Carries decoded images from the thread pool back to the GUI thread"""
+    loaded = pyqtSignal(str, QImage)
+
+class IconLoader(QRunnable):
+    """Decodes an icon file on a thread pool worker.
+
+    Only QImage may be used off the GUI thread; the QPixmap and QIcon are
+    built once the image is back on the GUI thread.
+    """
+    
+    def __init__(self, icon_path):
+        super().__init__()
+        self.icon_path = icon_path
+    
+    def run(self):
+        _icon_signals.loaded.emit(self.icon_path, QImage(self.icon_path))
+
+def _on_icon_loaded(icon_path, image):
+    """Cache a decoded icon and hand it to everyone waiting for it"""
+    icon = QIcon(QPixmap.fromImage(image)) if not image.isNull() else QIcon(icon_path)
+    _loaded_icons[icon_path] = icon
+    for callback in _pending_icon_callbacks.pop(icon_path, ()):
+        try:
+            callback(icon)
+        except RuntimeError:
+            # The widget waiting for the icon was deleted in the meantime
+            pass
+
+# Created on the GUI thread at import, so loaded is delivered there
+_icon_signals = _IconSignals()
+_icon_signals.loaded.connect(_on_icon_loaded)
+
+def load_icon_async(icon_path, callback):
+    """Call callback with the icon for icon_path, decoding it off the GUI thread"""
+    icon = _loaded_icons.get(icon_path)
+    if icon is not None:
+        callback(icon)
+        return
+    
+    callbacks = _pending_icon_callbacks.get(icon_path)
+    if callbacks is not None:
+        callbacks.append(callback)
+        return
+    _pending_icon_callbacks[icon_path] = [callback]
+    QThreadPool.globalInstance().start(IconLoader(icon_path))
+
+# Bundled images, looked up relative to the app directory
+APP_ICON_PATH = "icon.ico"
+BUTTON_IMAGE_PATH = "button.jpg"
+
+# Resolved lazily: main() changes into the app directory after imports, and
+# a QIcon can only be created once QApplication exists
+@functools.lru_cache(maxsize=None)
+def get_app_icon():
+    """Return the shared window icon, or None if icon.ico is missing"""
+    if os.path.exists(APP_ICON_PATH):
+        return get_icon(APP_ICON_PATH)
+    return None
+
+@functools.lru_cache(maxsize=None)
+def has_button_image():
+    """Check once whether the button background image is bundled"""
+    return os.path.exists(BUTTON_IMAGE_PATH)
+
+# Tool names and their URLs - a read-only view, so every caller can share it
+TOOL_URLS = types.MappingProxyType({
+    "Forums": "https://lostcity.rs",
+    "Clue Coordinates": "https://razgals.github.io/2004-Coordinates/",
+    "Clue Scroll Help": "https://razgals.github.io/Treasure/",
+    "World Map": "https://2004.lostcity.rs/worldmap", 
+    "Highscores": "https://2004.lostcity.rs/hiscores",
+    "Market Prices": "https://lostcity.markets",
+    "Quest Help": "https://2004.losthq.rs/?p=questguides",
+    "Skill Guides": "https://2004.losthq.rs/?p=skillguides",
+    "Skills Calculator": "https://2004.losthq.rs/?p=calculators",
+    "Bestiary": "https://2004.losthq.rs/?p=droptables"
+})
+
 def get_tool_urls():
     """Return mapping of tool names to their URLs"""
-    return {
-        "Forums": "https://lostcity.rs",
-        "Clue Coordinates": "https://razgals.github.io/2004-Coordinates/",
-        "Clue Scroll Help": "https://razgals.github.io/Treasure/",
-        "World Map": "https://2004.lostcity.rs/worldmap", 
-        "Highscores": "https://2004.lostcity.rs/hiscores",
-        "Market Prices": "https://lostcity.markets",
-        "Quest Help": "https://2004.losthq.rs/?p=questguides",
-        "Skill Guides": "https://2004.losthq.rs/?p=skillguides",
-        "Skills Calculator": "https://2004.losthq.rs/?p=calculators",
-        "Bestiary": "https://2004.losthq.rs/?p=droptables"
-    }
+    return TOOL_URLS
@@ -0,0 +1,22 @@
+# tools_profile.py - HTTP cache policy for the tool window and tool tab profiles
+from PyQt6.QtWebEngineCore import QWebEngineProfile
+import config
+
+# Upper bound for a tool profile's on-disk HTTP cache
+TOOLS_HTTP_CACHE_SIZE = 100 * 1024 * 1024
+
+# Upper bound for a tool profile's in-memory HTTP cache. Every tool has its
+# own pooled profile that lives as long as the app, so this is kept small
+TOOLS_MEMORY_CACHE_SIZE = 8 * 1024 * 1024
+
+
+def get_tools_http_cache(disk_size=TOOLS_HTTP_CACHE_SIZE):
+    """Return the (type, maximum size) HTTP cache for tool profiles.
+
+    Tools are opened and closed often, so by default their HTTP cache lives in
+    memory and no cache index is set up on disk for every open.
+    """
+    if config.get_config_value("tool_disk_cache", False):
+        return QWebEngineProfile.HttpCacheType.DiskHttpCache, disk_size
+    return QWebEngineProfile.HttpCacheType.MemoryHttpCache, TOOLS_MEMORY_CACHE_SIZE
+
@@ -1,15 +1,192 @@
 # world_switcher.py - Updated to allow same-world switching when detail mode differs
+import functools
 import os
 import json
-import urllib.request
+import re
+import time
+import types
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QPushButton, 
                              QLabel, QScrollArea, QCheckBox, QHBoxLayout, QMessageBox)
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QSize
-from PyQt6.QtGui import QFont, QIcon, QColor, QPalette
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QSize, QUrl, QThreadPool
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
+from PyQt6.QtGui import QIcon, QColor, QPalette
 from PyQt6.QtSvg import QSvgRenderer
 from PyQt6.QtGui import QPixmap, QPainter
 import config
 from font_loader import font_loader
+from styles import BUTTON_IMAGE_PATH, ICONS_DIR, get_app_icon, get_bundled_icon_files, has_button_image
+
+WORLDS_API_URL = "https://2004.losthq.rs/pages/api/worlds.php"
+
+# World number in a game URL, e.g. "world=2" or "world:2"
+_WORLD_RE = re.compile(r'world[=:](\d+)', re.IGNORECASE)
+
+# Give up on the world list request after this long
+WORLDS_REQUEST_TIMEOUT_MS = 10000
+
+# The last response is kept on disk and shown straight away. Within the fresh
+# window it is used as is; after that it is shown while a new copy is fetched,
+# and once it is older than the stale window it is ignored.
+WORLDS_CACHE_FRESH_SECONDS = 60
+WORLDS_CACHE_STALE_SECONDS = 24 * 60 * 60
+
+# Flag shown for each world location (read-only, built once at import)
+FLAG_FILES = types.MappingProxyType({
+    "US (Central)": "us.svg",
+    "US (West)": "us.svg",
+    "US (East)": "us.svg",
+    "Finland": "fin.svg",
+    "Australia": "aus.svg",
+    "Japan": "jp.svg",
+    "Singapore": "sg.svg",
+})
+
+
+def parse_worlds_data(data):
+    """Decode the worlds API response and make sure every world has hd and ld URLs"""
+    worlds_data = json.loads(data.decode('utf-8'))
+    for world in worlds_data:
+        if 'hd' not in world:
+            world['hd'] = f"https://w{world['world']}-2004.lostcity.rs/rs2.cgi?plugin=0&world={world['world']}&lowmem=0"
+        if 'ld' not in world:
+            world['ld'] = f"https://w{world['world']}-2004.lostcity.rs/rs2.cgi?plugin=0&world={world['world']}&lowmem=1"
+    return worlds_data
+
+
+# World button styles, with and without the button.jpg background
+WORLD_BUTTON_CURRENT_IMAGE_STYLE = f"""
+    QPushButton {{
+        background: url({BUTTON_IMAGE_PATH}) center center stretch;
+        background-color: rgba(74, 106, 74, 180);
+        border: 2px solid #2a2a2a;
+        border-radius: 0px;
+        padding: 8px;
+        color: #f5e6c0;
+        font-weight: bold;
+        font-size: 20px;
+        text-align: left;
+    }}
+    QPushButton:hover {{
+        background-color: rgba(90, 122, 90, 200);
+    }}
+"""
+
+WORLD_BUTTON_CURRENT_STYLE = """
+    QPushButton {
+        background-color: #4a6a4a;
+        border: 2px solid #2a2a2a;
+        border-radius: 0px;
+        padding: 8px;
+        color: #f5e6c0;
+        font-weight: bold;
+        font-size: 20px;
+        text-align: left;
+    }
+    QPushButton:hover {
+        background-color: #5a7a5a;
+    }
+"""
+
+WORLD_BUTTON_IMAGE_STYLE = f"""
+    QPushButton {{
+        background: url({BUTTON_IMAGE_PATH}) center center stretch;
+        border: 2px solid #2a2a2a;
+        border-radius: 0px;
+        padding: 8px;
+        color: #f5e6c0;
+        font-weight: bold;
+        font-size: 20px;
+        text-align: left;
+    }}
+    QPushButton:hover {{
+        background-color: rgba(139, 74, 74, 120);
+        border-color: #8b4a4a;
+    }}
+"""
+
+WORLD_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #8b4a4a;
+        border: 2px solid #2a2a2a;
+        border-radius: 0px;
+        padding: 8px;
+        color: #f5e6c0;
+        font-weight: bold;
+        font-size: 20px;
+        text-align: left;
+    }
+    QPushButton:hover {
+        background-color: #a55a5a;
+        border-color: #8b4a4a;
+    }
+"""
+
+
+@functools.lru_cache(maxsize=8)
+def extract_world_from_url(url):
+    """Extract world number from URL"""
+    if not url:
+        return None
+    match = _WORLD_RE.search(url)
+    return match.group(1) if match else None
+
+
+@functools.lru_cache(maxsize=None)
+def get_flag_filename(location):
+    """Get flag filename based on location"""
+    return FLAG_FILES.get(location, "us.svg")
+
+
+@functools.lru_cache(maxsize=32)
+def load_svg_icon(svg_filename, width=32, height=20):
+    """Render an SVG icon to a QIcon with flag proportions, once per file and size"""
+    if svg_filename not in get_bundled_icon_files():
+        return None
+    try:
+        renderer = QSvgRenderer(os.path.join(ICONS_DIR, svg_filename))
+        pixmap = QPixmap(width, height)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        renderer.render(painter)
+        painter.end()
+        return QIcon(pixmap)
+    except Exception as e:
+        print(f"Error loading SVG {svg_filename}: {e}")
+        return None
+
+
+def preload_flag_icons():
+    """Render every known flag ahead of time so opening the switcher doesn't"""
+    for flag_svg in set(FLAG_FILES.values()):
+        load_svg_icon(flag_svg, 32, 20)
+
+
+def get_worlds_cache_path():
+    """Get the file holding the last worlds API response"""
+    return os.path.join(config.get_persistent_cache_dir(), "worlds_cache.json")
+
+
+def read_worlds_cache():
+    """Return the cached worlds API response and its age in seconds, or (None, None)"""
+    cache_path = get_worlds_cache_path()
+    try:
+        age = time.time() - os.path.getmtime(cache_path)
+        with open(cache_path, "rb") as f:
+            return f.read(), age
+    except OSError:
+        return None, None
+
+
+def write_worlds_cache(payload):
+    """Atomically store a worlds API response; its mtime records when it was fetched"""
+    cache_path = get_worlds_cache_path()
+    temp_file = cache_path + ".tmp"
+    try:
+        with open(temp_file, "wb") as f:
+            f.write(payload)
+        os.replace(temp_file, cache_path)
+    except OSError as e:
+        print(f"Error saving world data cache: {e}")
 
 
 class WorldSwitcherWindow(QMainWindow):
@@ -21,58 +198,122 @@ class WorldSwitcherWindow(QMainWindow):
         self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose, False)
         self.setWindowFlags(Qt.WindowType.Window)
         
-        if os.path.exists("icon.ico"):
-            self.setWindowIcon(QIcon("icon.ico"))
+        app_icon = get_app_icon()
+        if app_icon is not None:
+            self.setWindowIcon(app_icon)
         
         # Set black background
         palette = QPalette()
         palette.setColor(QPalette.ColorRole.Window, QColor(0, 0, 0))
         self.setPalette(palette)
         
-        self.current_world_url = current_world_url
+        self.set_current_world_url(current_world_url)
         
-        # Load world data from remote URL
-        self.worlds_data = self.load_worlds_data()
+        # World data comes from the disk cache if it has one and is refreshed
+        # asynchronously; the list shows a placeholder until data is available
+        self.worlds_data = []
+        self.worlds_by_num = {}
+        self.worlds_payload = None
+        self.worlds_status = "Loading worlds..."
+        self.refresh_requested = False
+        self.worlds_reply = None
+        self.network = QNetworkAccessManager(self)
+        self.network.finished.connect(self.on_worlds_reply)
+        self.load_cached_worlds_data()
         
         # Detect current detail mode from URL or load from config
-        self.is_high_detail = self.detect_detail_mode(current_world_url)
+        self.is_high_detail = self.current_detail
         if self.is_high_detail is None:
             self.is_high_detail = config.get_config_value("world_detail_high", True)
         
+        # World button styles are picked once; button.jpg is only checked here
+        if has_button_image():
+            self.current_button_style = WORLD_BUTTON_CURRENT_IMAGE_STYLE
+            self.normal_button_style = WORLD_BUTTON_IMAGE_STYLE
+        else:
+            self.current_button_style = WORLD_BUTTON_CURRENT_STYLE
+            self.normal_button_style = WORLD_BUTTON_STYLE
+        
         # Load window geometry
         self.load_window_geometry()
         self.setMinimumSize(500, 400)
         
+        # Fonts go on before the widgets are built so they inherit them directly
+        self.force_apply_fonts()
         self.setup_ui()
-        QTimer.singleShot(100, self.force_apply_fonts)
+    
+    def load_cached_worlds_data(self):
+        """Show the cached world list and revalidate it once it is no longer fresh"""
+        payload, age = read_worlds_cache()
+        if payload is not None and age <= WORLDS_CACHE_STALE_SECONDS:
+            try:
+                self.set_worlds_data(parse_worlds_data(payload), payload)
+                print(f"Loaded {len(self.worlds_data)} worlds from cache")
+                if age <= WORLDS_CACHE_FRESH_SECONDS:
+                    return
+            except (ValueError, KeyError, TypeError) as e:
+                print(f"Ignoring unreadable world data cache: {e}")
+        
+        self.load_worlds_data()
+    
+    def set_worlds_data(self, worlds_data, payload):
+        """Replace the world list and index it by world number"""
+        self.worlds_by_num = {str(world["world"]): world for world in worlds_data}
+        self.worlds_data = worlds_data
+        self.worlds_payload = payload
     
     def load_worlds_data(self):
-        """Load world data from remote URL"""
-        worlds_data = []
+        """Start fetching world data from the remote URL without blocking the UI"""
+        # Only the newest request counts - drop one that is still in flight
+        stale_reply, self.worlds_reply = self.worlds_reply, None
+        if stale_reply is not None:
+            stale_reply.abort()
+        
+        print(f"Fetching world data from: {WORLDS_API_URL}")
+        request = QNetworkRequest(QUrl(WORLDS_API_URL))
+        request.setTransferTimeout(WORLDS_REQUEST_TIMEOUT_MS)
+        self.worlds_reply = self.network.get(request)
+    
+    def on_worlds_reply(self, reply):
+        """Parse a finished world data request and show the result"""
+        reply.deleteLater()
+        if reply is not self.worlds_reply:
+            # Superseded by a newer request
+            return
+        self.worlds_reply = None
+        
+        changed = False
         try:
-            # Fetch world data from remote URL
-            remote_url = "https://2004.losthq.rs/pages/api/worlds.php"
-            print(f"Fetching world data from: {remote_url}")
-            
-            with urllib.request.urlopen(remote_url, timeout=10) as response:
-                data = response.read().decode('utf-8')
-                worlds_data = json.loads(data)
-                
-            print(f"Loaded {len(worlds_data)} worlds from remote API")
+            if reply.error() != QNetworkReply.NetworkError.NoError:
+                raise OSError(reply.errorString())
+            payload = reply.readAll().data()
+            if payload != self.worlds_payload:
+                self.set_worlds_data(parse_worlds_data(payload), payload)
+                changed = True
+            self.worlds_status = "No worlds available"
+            print(f"Loaded {len(self.worlds_data)} worlds from remote API")
             
+            # Rewrite even an unchanged response - its mtime marks it fresh again
+            QThreadPool.globalInstance().start(functools.partial(write_worlds_cache, payload))
         except Exception as e:
+            # Keep whatever list is already shown
             print(f"Error loading world data from remote URL: {e}")
-            # No fallback data - return empty list if fetch fails
-            worlds_data = []
+            self.worlds_status = "Could not load world list"
         
-        # Ensure all worlds have both hd and ld URLs
-        for world in worlds_data:
-            if 'hd' not in world:
-                world['hd'] = f"https://w{world['world']}-2004.lostcity.rs/rs2.cgi?plugin=0&world={world['world']}&lowmem=0"
-            if 'ld' not in world:
-                world['ld'] = f"https://w{world['world']}-2004.lostcity.rs/rs2.cgi?plugin=0&world={world['world']}&lowmem=1"
+        # An unchanged list is already on screen
+        if changed or not self.worlds_data:
+            self.schedule_display_worlds()
         
-        return worlds_data
+        if self.refresh_requested:
+            self.refresh_requested = False
+            self.refresh_btn.setText("Refreshed!")
+            QTimer.singleShot(1000, lambda: self.refresh_btn.setText("Refresh"))
+    
+    def set_current_world_url(self, url):
+        """Store the current world URL along with its parsed world and detail mode"""
+        self.current_world_url = url
+        self.current_world = extract_world_from_url(url)
+        self.current_detail = self.detect_detail_mode(url)
     
     def detect_detail_mode(self, url):
         """Detect if URL is high or low detail. Returns True for high, False for low, None if unknown"""
@@ -89,19 +330,7 @@ class WorldSwitcherWindow(QMainWindow):
     
     def force_apply_fonts(self):
         """Apply readable fonts to world switcher - 1.7x larger"""
-        font = QFont()
-        if font_loader.is_custom_font_available():
-            font.setFamily(font_loader.get_font_family_name())
-        else:
-            test_font = QFont("Runescape-Quill-Caps", 20)
-            if test_font.exactMatch():
-                font.setFamily("Runescape-Quill-Caps")
-            else:
-                font.setFamily("Arial")
-        
-        font.setPointSize(20)
-        font.setWeight(QFont.Weight.Normal)
-        self.setFont(font)
+        self.setFont(font_loader.get_ui_font(20))
     
     def setup_ui(self):
         """Setup the UI"""
@@ -248,9 +477,26 @@ class WorldSwitcherWindow(QMainWindow):
         self.worlds_layout.setSpacing(5)
         self.worlds_layout.setContentsMargins(5, 5, 5, 5)
         
+        # World buttons are created once and updated in place on every redraw;
+        # they sit above the status label and the trailing stretch
+        self.world_buttons = []
+        # (world, detail of the current URL, detail toggle) the list last showed
+        self.rendered_highlight = None
+        self.status_label = QLabel()
+        self.status_label.setStyleSheet("QLabel { color: #f5e6c0; font-size: 20px; }")
+        self.worlds_layout.addWidget(self.status_label)
+        self.worlds_layout.addStretch()
+        
         scroll_area.setWidget(self.worlds_widget)
         layout.addWidget(scroll_area)
         
+        # Redraws requested in quick succession (detail toggles, world changes)
+        # are coalesced into one
+        self.display_timer = QTimer(self)
+        self.display_timer.setSingleShot(True)
+        self.display_timer.setInterval(50)
+        self.display_timer.timeout.connect(self.display_worlds)
+        
         # Display worlds
         self.display_worlds()
     
@@ -260,24 +506,11 @@ class WorldSwitcherWindow(QMainWindow):
         config.set_config_value("world_switch_warning", show_warning)
     
     def refresh_world_data(self):
-        """Reload world data from remote URL and update the display"""
+        """Reload world data from remote URL; the display updates when it arrives"""
         print("Refreshing world data from remote URL...")
-        
-        # Store current world and detail mode to maintain selection
-        current_world = self.extract_world_from_url(self.current_world_url)
-        current_detail = self.detect_detail_mode(self.current_world_url)
-        
-        # Reload world data from remote
-        self.worlds_data = self.load_worlds_data()
-        
-        # Refresh display
-        self.display_worlds()
-        
-        # Show feedback
-        self.refresh_btn.setText("Refreshed!")
-        QTimer.singleShot(1000, lambda: self.refresh_btn.setText("Refresh"))
-        
-        print(f"World data refreshed - {len(self.worlds_data)} worlds loaded from remote")
+        self.refresh_requested = True
+        self.refresh_btn.setText("Refreshing...")
+        self.load_worlds_data()
     
     def on_detail_mode_changed(self, state):
         """Handle detail mode checkbox change"""
@@ -288,7 +521,7 @@ class WorldSwitcherWindow(QMainWindow):
         print(f"Graphics mode changed to: {mode_text}")
         
         # Refresh display to update buttons
-        self.display_worlds()
+        self.schedule_display_worlds()
     
     def build_world_url(self, world_data, is_high_detail):
         """Build the complete world URL based on detail mode and world data"""
@@ -297,168 +530,85 @@ class WorldSwitcherWindow(QMainWindow):
         else:
             return world_data.get("ld", f"https://w{world_data['world']}-2004.lostcity.rs/rs2.cgi?plugin=0&world={world_data['world']}&lowmem=1")
     
-    def load_svg_icon(self, svg_filename, width=32, height=20):
-        """Load and render SVG icon to QIcon with flag proportions"""
-        svg_path = os.path.join("icons", svg_filename)
-        if os.path.exists(svg_path):
-            try:
-                renderer = QSvgRenderer(svg_path)
-                pixmap = QPixmap(width, height)
-                pixmap.fill(Qt.GlobalColor.transparent)
-                painter = QPainter(pixmap)
-                renderer.render(painter)
-                painter.end()
-                return QIcon(pixmap)
-            except Exception as e:
-                print(f"Error loading SVG {svg_filename}: {e}")
-        return None
-    
-    def get_flag_filename(self, location):
-        """Get flag filename based on location"""
-        flag_map = {
-            "US (Central)": "us.svg",
-            "US (West)": "us.svg",
-            "US (East)": "us.svg",
-            "Finland": "fin.svg",
-            "Australia": "aus.svg",
-            "Japan": "jp.svg",
-            "Singapore": "sg.svg",
-        }
-        return flag_map.get(location, "us.svg")
+    def schedule_display_worlds(self):
+        """Redraw the world list once pending changes have settled"""
+        self.display_timer.start()
     
     def display_worlds(self):
         """Display the worlds in the UI based on current detail mode toggle"""
-        # Clear existing widgets
-        while self.worlds_layout.count():
-            child = self.worlds_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+        self.status_label.setText(self.worlds_status)
+        self.status_label.setVisible(not self.worlds_data)
         
         # Extract current world number
-        current_world = self.extract_world_from_url(self.current_world_url)
-        current_detail = self.detect_detail_mode(self.current_world_url)
-        
-        # Create buttons based on toggle state and loaded world data
-        for world_data in self.worlds_data:
-            world_num = world_data["world"]
-            location = world_data["location"]
-            player_count = world_data.get("count", 0)
-            flag_svg = self.get_flag_filename(location)
-            
-            world_btn = self.create_world_button(
-                world_data, flag_svg, self.is_high_detail,
-                is_current=(str(world_num) == current_world and current_detail == self.is_high_detail)
-            )
-            self.worlds_layout.addWidget(world_btn)
-        
-        self.worlds_layout.addStretch()
+        current_world = self.current_world
+        current_detail = self.current_detail
+        self.rendered_highlight = (current_world, current_detail, self.is_high_detail)
+        if current_detail == self.is_high_detail:
+            current_world_data = self.worlds_by_num.get(current_world)
+        else:
+            current_world_data = None
+        
+        # Reuse the existing buttons, adding or removing only the difference
+        while len(self.world_buttons) < len(self.worlds_data):
+            btn = self.create_world_button()
+            self.worlds_layout.insertWidget(len(self.world_buttons), btn)
+            self.world_buttons.append(btn)
+        while len(self.world_buttons) > len(self.worlds_data):
+            btn = self.world_buttons.pop()
+            self.worlds_layout.removeWidget(btn)
+            btn.deleteLater()
+        
+        for btn, world_data in zip(self.world_buttons, self.worlds_data):
+            self.update_world_button(btn, world_data, world_data is current_world_data)
     
-    def create_world_button(self, world_data, flag_svg, is_high_detail, is_current=False):
-        """Create a button for a world with button.jpg background and player count"""
+    def create_world_button(self):
+        """Create an empty world button; update_world_button fills it in"""
         btn = QPushButton()
         btn.setFixedHeight(45)
+        # Country flags keep flag proportions (wider than tall)
+        btn.setIconSize(QSize(32, 20))
+        btn.world_data = None
+        btn.flag_svg = None
+        btn.is_current = None
+        btn.clicked.connect(self.on_world_button_clicked)
+        return btn
+    
+    def update_world_button(self, btn, world_data, is_current):
+        """Point a world button at world_data, touching only what changed"""
+        btn.world_data = world_data
         
-        # Load country flag icon with flag proportions (wider than tall)
-        if flag_svg:
-            icon = self.load_svg_icon(flag_svg, 32, 20)
-            if icon:
-                btn.setIcon(icon)
-                btn.setIconSize(QSize(32, 20))
+        # Load country flag icon
+        flag_svg = get_flag_filename(world_data["location"])
+        if flag_svg != btn.flag_svg:
+            btn.flag_svg = flag_svg
+            icon = load_svg_icon(flag_svg, 32, 20)
+            btn.setIcon(icon if icon else QIcon())
         
-        # Create button text with player count
+        # Format button text with player count
         world_num = world_data["world"]
         location = world_data["location"]
         player_count = world_data.get("count", 0)
-        detail_text = "HD" if is_high_detail else "LD"
-        
-        # Format button text with player count
+        detail_text = "HD" if self.is_high_detail else "LD"
         btn_text = f"World {world_num} - {player_count} players - {location} ({detail_text})"
-        btn.setText(btn_text)
-        
-        # Check if button.jpg exists
-        button_image_path = "button.jpg"
+        if btn.text() != btn_text:
+            btn.setText(btn_text)
         
         # Style based on whether it's the current world
-        if is_current:
-            if os.path.exists(button_image_path):
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background: url({button_image_path}) center center stretch;
-                        background-color: rgba(74, 106, 74, 180);
-                        border: 2px solid #2a2a2a;
-                        border-radius: 0px;
-                        padding: 8px;
-                        color: #f5e6c0;
-                        font-weight: bold;
-                        font-size: 20px;
-                        text-align: left;
-                    }}
-                    QPushButton:hover {{
-                        background-color: rgba(90, 122, 90, 200);
-                    }}
-                """)
-            else:
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #4a6a4a;
-                        border: 2px solid #2a2a2a;
-                        border-radius: 0px;
-                        padding: 8px;
-                        color: #f5e6c0;
-                        font-weight: bold;
-                        font-size: 20px;
-                        text-align: left;
-                    }
-                    QPushButton:hover {
-                        background-color: #5a7a5a;
-                    }
-                """)
-        else:
-            if os.path.exists(button_image_path):
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background: url({button_image_path}) center center stretch;
-                        border: 2px solid #2a2a2a;
-                        border-radius: 0px;
-                        padding: 8px;
-                        color: #f5e6c0;
-                        font-weight: bold;
-                        font-size: 20px;
-                        text-align: left;
-                    }}
-                    QPushButton:hover {{
-                        background-color: rgba(139, 74, 74, 120);
-                        border-color: #8b4a4a;
-                    }}
-                """)
-            else:
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #8b4a4a;
-                        border: 2px solid #2a2a2a;
-                        border-radius: 0px;
-                        padding: 8px;
-                        color: #f5e6c0;
-                        font-weight: bold;
-                        font-size: 20px;
-                        text-align: left;
-                    }
-                    QPushButton:hover {
-                        background-color: #a55a5a;
-                        border-color: #8b4a4a;
-                    }
-                """)
-        
-        # Connect click handler
-        btn.clicked.connect(lambda: self.on_world_clicked(world_data, is_high_detail))
-        
-        return btn
+        if is_current != btn.is_current:
+            btn.is_current = is_current
+            btn.setStyleSheet(self.current_button_style if is_current else self.normal_button_style)
+    
+    def on_world_button_clicked(self):
+        """Switch to the world of the clicked button in the current detail mode"""
+        btn = self.sender()
+        if btn is not None and btn.world_data is not None:
+            self.on_world_clicked(btn.world_data, self.is_high_detail)
     
     def on_world_clicked(self, world_data, is_high_detail):
         """Handle world button click with optional warning"""
         # Extract current world and detail mode
-        current_world = self.extract_world_from_url(self.current_world_url)
-        current_detail = self.detect_detail_mode(self.current_world_url)
+        current_world = self.current_world
+        current_detail = self.current_detail
         clicked_world = str(world_data["world"])
         
         # Check if user is clicking the EXACT same world and detail mode
@@ -498,7 +648,7 @@ class WorldSwitcherWindow(QMainWindow):
         world_info = f"W{world_num} {location} ({detail_mode})"
         
         self.world_selected.emit(world_url, world_info, is_high_detail)
-        self.current_world_url = world_url
+        self.set_current_world_url(world_url)
         self.is_high_detail = is_high_detail
         
         # Save preference
@@ -508,31 +658,23 @@ class WorldSwitcherWindow(QMainWindow):
         print(f"URL: {world_url}")
         
         # Refresh display to update current world highlighting
-        self.display_worlds()
-    
-    def extract_world_from_url(self, url):
-        """Extract world number from URL"""
-        if not url:
-            return None
-        
-        import re
-        match = re.search(r'world[=:](\d+)', url, re.IGNORECASE)
-        if match:
-            return match.group(1)
-        return None
+        self.schedule_display_worlds()
     
     def update_current_world(self, world_url):
         """Update the currently selected world and detect its detail mode"""
-        self.current_world_url = world_url
+        self.set_current_world_url(world_url)
         
         # Auto-detect detail mode from new URL
-        detected_detail = self.detect_detail_mode(world_url)
-        if detected_detail is not None:
+        detected_detail = self.current_detail
+        if detected_detail is not None and detected_detail != self.is_high_detail:
             self.is_high_detail = detected_detail
             self.detail_checkbox.setChecked(self.is_high_detail)
             config.set_config_value("world_detail_high", self.is_high_detail)
         
-        self.display_worlds()
+        # Most URL changes stay on the same world - nothing to redraw then
+        highlight = (self.current_world, detected_detail, self.is_high_detail)
+        if highlight != self.rendered_highlight:
+            self.schedule_display_worlds()
     
     def load_window_geometry(self):
         """Load window geometry from config"""
@@ -551,19 +693,30 @@ class WorldSwitcherWindow(QMainWindow):
             print(f"Error loading world switcher geometry: {e}")
             self.setGeometry(250, 250, 600, 500)
     
+    def get_geometry_list(self):
+        """Current window geometry in the config's [x, y, w, h] form"""
+        geom = self.geometry()
+        return [geom.x(), geom.y(), geom.width(), geom.height()]
+    
     def save_window_geometry(self):
         """Save window geometry to config"""
         try:
-            geom = self.geometry()
-            config.set_config_value("world_switcher_geometry", 
-                                   [geom.x(), geom.y(), geom.width(), geom.height()])
+            config.set_config_value("world_switcher_geometry", self.get_geometry_list())
         except Exception as e:
             print(f"Error saving world switcher geometry: {e}")
     
     def closeEvent(self, event):
         """Save geometry and settings when closing"""
-        self.save_window_geometry()
-        config.set_config_value("world_detail_high", self.is_high_detail)
+        # A debounced geometry save still pending is covered by this one
+        if hasattr(self, 'save_timer'):
+            self.save_timer.stop()
+        try:
+            config.set_config_values({
+                "world_switcher_geometry": self.get_geometry_list(),
+                "world_detail_high": self.is_high_detail,
+            })
+        except Exception as e:
+            print(f"Error saving world switcher settings: {e}")
         event.accept()
     
     def resizeEvent(self, event):